@@ -1,21 +1,172 @@
+import io
 import subprocess
 import tempfile
 import os
 import re
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from .lexical_analyzer import LexicalAnalyzer
-from .parser import Parser, ASTNode
+from .parser import Parser, ASTNode, NodeTypeId
 
 class CCompiler:
+    # Maximum number of compiled executables kept for reuse
+    EXE_CACHE_SIZE = 128
+
+    # Maximum number of memoized analyze_code results
+    ANALYSIS_CACHE_SIZE = 256
+
+    # All input functions in one alternation so detection is a single scan.
+    # The primary pattern is bytes-level and case-sensitive - C input
+    # functions are lowercase - so the scan skips the case-folding tables;
+    # the folded fallback covers pathological uppercase spellings.
+    _INPUT_RE = re.compile(
+        rb'\b(?:scanf|gets|fgets|getchar|getc|read|fread|getline)\s*\('
+    )
+    _INPUT_RE_CI = re.compile(
+        r'\b(?:scanf|gets|fgets|getchar|getc|read|fread|getline)\s*\(',
+        re.IGNORECASE
+    )
+
+    # Known diagnostic categories in one alternation; the matching named
+    # group selects the explanation template below
+    _ERR_RE = re.compile(
+        r'(?P<link>undefined reference to)|'
+        r'(?P<syntax>expected .*before)|'
+        r'(?P<impl>implicit declaration)|'
+        r'(?P<unused>unused variable)|'
+        r'(?P<ctrl>control reaches end)',
+        re.IGNORECASE
+    )
+
+    _ERR_TEMPLATES = {
+        'link': (
+            "\n- **Type**: Linker Error"
+            "\n- **Cause**: Function or variable is used but not defined"
+            "\n- **Solution**: Implement the missing function or include the correct header"
+        ),
+        'syntax': (
+            "\n- **Type**: Syntax Error"
+            "\n- **Cause**: Missing semicolon, bracket, or other syntax element"
+            "\n- **Solution**: Check the line mentioned and add missing syntax"
+        ),
+        'impl': (
+            "\n- **Type**: Function Declaration Error"
+            "\n- **Cause**: Function is used without being declared"
+            "\n- **Solution**: Add function prototype or include appropriate header"
+        ),
+        'unused': (
+            "\n- **Type**: Warning"
+            "\n- **Cause**: Variable is declared but never used"
+            "\n- **Solution**: Remove unused variable or use it in your code"
+        ),
+        'ctrl': (
+            "\n- **Type**: Warning"
+            "\n- **Cause**: Function doesn't return a value in all code paths"
+            "\n- **Solution**: Add return statement or ensure all paths return a value"
+        ),
+        None: (
+            "\n- **Type**: Compilation Error"
+            "\n- **Cause**: Syntax or semantic error in the code"
+            "\n- **Solution**: Review the error message and fix the indicated issue"
+        ),
+    }
+
     def __init__(self):
         self.lexer = LexicalAnalyzer()
-        self.parser = None
         self.output = []
         self.errors = []
         self.warnings = []
+
+        # Detect ccache once so repeat compiles of identical source hit its cache
+        self.ccache_path = shutil.which('ccache')
+        self.compile_env = None
+        if self.ccache_path:
+            env = os.environ.copy()
+            env['CCACHE_DIR'] = os.path.join(
+                os.path.expanduser('~'), '.cache', 'minicompiler', 'ccache'
+            )
+            env['CCACHE_COMPRESS'] = '1'
+            env['CCACHE_COMPRESSLEVEL'] = '1'
+            env['CCACHE_SLOPPINESS'] = 'time_macros,include_file_mtime'
+            self.compile_env = env
+
+        # In-process cache of compiled executables keyed by source hash, so
+        # re-running identical code skips gcc entirely. Executables live in a
+        # persistent temp dir and are unlinked on LRU eviction.
+        self._exe_cache: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._exe_cache_lock = threading.Lock()
+        # Prefer RAM-backed tmpfs for the executables so writing and loading
+        # them never touches disk; fall back to the regular temp dir
+        tmpfs = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        self._exe_cache_dir = tempfile.mkdtemp(prefix='minicc-', dir=tmpfs)
+
+        # Minimal environment for user programs; built once per compiler
+        self._run_env = {
+            key: value for key, value in os.environ.items()
+            if key in ('PATH', 'LANG', 'LC_ALL', 'TERM')
+        }
+
+        # Memoized analyze_code results keyed by source hash. The
+        # interactive-input flow calls analyze_code twice for the same
+        # source (prompt round-trip, then the run with input), and the
+        # edit-rerun loop resubmits identical code constantly.
+        self._analysis_cache: 'OrderedDict[bytes, Dict]' = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+
+        # Dispatch table for the AST walk, keyed by integer node-type id;
+        # one int-keyed dict lookup per node instead of string compares
+        self._ast_handlers = {
+            NodeTypeId.FUNCTION_DEFINITION.value: self._analyze_function_definition,
+            NodeTypeId.FUNCTION_DECLARATION.value: self._analyze_function_declaration,
+            NodeTypeId.VARIABLE_DECLARATION.value: self._analyze_variable_declaration,
+            NodeTypeId.INCLUDE.value: self._analyze_include,
+            NodeTypeId.DEFINE.value: self._analyze_define,
+            NodeTypeId.STRUCT_DEFINITION.value: self._analyze_struct_definition,
+            NodeTypeId.COMMENT.value: self._analyze_comment,
+        }
+
+    def _exe_cache_key(self, source_code: str) -> bytes:
+        """Hash the source plus the compile flags baked into compile_code"""
+        return hashlib.blake2b(
+            source_code.encode() + b'|c99|Wall|Wextra', digest_size=16
+        ).digest()
+
+    def _get_cached_exe(self, key: bytes) -> Optional[str]:
+        """Return a previously compiled executable for this key, if any"""
+        with self._exe_cache_lock:
+            exe_path = self._exe_cache.get(key)
+            if exe_path and os.path.exists(exe_path):
+                self._exe_cache.move_to_end(key)
+                return exe_path
+            return None
+
+    def _store_cached_exe(self, key: bytes, exe_path: str):
+        """Remember a compiled executable, evicting the oldest entries if full"""
+        evicted = []
+        with self._exe_cache_lock:
+            self._exe_cache[key] = exe_path
+            self._exe_cache.move_to_end(key)
+            while len(self._exe_cache) > self.EXE_CACHE_SIZE:
+                evicted.append(self._exe_cache.popitem(last=False)[1])
+        # Unlink outside the lock so concurrent requests aren't serialized
+        # behind filesystem work
+        for path in evicted:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
         
-    def compile_and_run(self, source_code: str, program_input: str = '') -> Dict:
-        """Compile and run C code, return results"""
+    def compile_and_run(self, source_code: str, program_input: str = '', analyze: bool = False) -> Dict:
+        """Compile and run C code, return results
+
+        Pass analyze=True to also collect -Wall/-Wextra warnings via a
+        separate syntax-only lint pass; the run-path compile itself is
+        warning-free for speed.
+        """
         result = {
             'success': False,
             'output': '',
@@ -36,6 +187,20 @@ class CCompiler:
             
             if interactive_detected:
                 if not program_input:
+                    # Compile now so the follow-up call with input starts
+                    # instantly - the exe lands in the content-addressed
+                    # cache that _run_with_input consults. Compile errors
+                    # surface immediately instead of after input is sent.
+                    key = self._exe_cache_key(source_code)
+                    if not self._get_cached_exe(key):
+                        exe_path = os.path.join(self._exe_cache_dir, key.hex() + '.exe')
+                        compile_result = self.compile_source(source_code, exe_path)
+                        if not compile_result['success']:
+                            result['errors'] = compile_result['errors']
+                            result['warnings'] += compile_result['warnings']
+                            return result
+                        self._store_cached_exe(key, exe_path)
+
                     # First run - show input prompt
                     result['output'] = "🔵 INTERACTIVE PROGRAM DETECTED\n\n"
                     result['output'] += "This program uses scanf() or other input functions.\n"
@@ -53,40 +218,62 @@ class CCompiler:
                     # Second run - execute with input
                     return self._run_with_input(source_code, program_input)
             
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.c', delete=False) as c_file:
-                c_file.write(source_code)
-                c_file_path = c_file.name
-            
-            exe_path = c_file_path.replace('.c', '.exe')
-            
-            # Compile the code
-            compile_result = self.compile_code(c_file_path, exe_path)
-            
+            # Warnings are only gathered when explicitly requested
+            if analyze:
+                result['warnings'] = self.lint_source(source_code)['warnings']
+
+            # Reuse a previously compiled executable for identical source
+            key = self._exe_cache_key(source_code)
+            exe_path = self._get_cached_exe(key)
+            if exe_path:
+                run_result = self.run_program(exe_path)
+                result['output'] = run_result['output']
+                result['success'] = True
+                return result
+
+            exe_path = os.path.join(self._exe_cache_dir, key.hex() + '.exe')
+
+            # Compile the code (source piped over stdin, no temp .c file)
+            compile_result = self.compile_source(source_code, exe_path)
+
             if compile_result['success']:
-                # Run the compiled program
+                # Run the compiled program and keep the exe for repeat runs
+                self._store_cached_exe(key, exe_path)
                 run_result = self.run_program(exe_path)
                 result['output'] = run_result['output']
                 result['success'] = True
             else:
                 result['errors'] = compile_result['errors']
-                result['warnings'] = compile_result['warnings']
-            
-            # Clean up temporary files
-            try:
-                os.unlink(c_file_path)
-                if os.path.exists(exe_path):
-                    os.unlink(exe_path)
-            except:
-                pass
-                
+                result['warnings'] += compile_result['warnings']
+
         except Exception as e:
             result['errors'].append(f"Compiler Error: {str(e)}")
-        
+
         return result
-    
+
+    def compile_and_run_batch(self, sources: List[str]) -> List[Dict]:
+        """Compile and run several programs concurrently, one gcc per core
+
+        subprocess.run releases the GIL while gcc executes, so a thread pool
+        is enough to keep every core busy with an independent compile.
+        Results come back in the same order as the input list.
+        """
+        if not sources:
+            return []
+
+        workers = min(len(sources), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.compile_and_run, sources))
+
     def analyze_code(self, source_code: str) -> Dict:
         """Analyze C code for structure and potential issues"""
+        h = hashlib.blake2b(source_code.encode(), digest_size=16).digest()
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(h)
+            if cached is not None:
+                self._analysis_cache.move_to_end(h)
+                return cached
+
         analysis = {
             'functions': [],
             'variables': [],
@@ -103,96 +290,128 @@ class CCompiler:
             tokens = self.lexer.tokenize(source_code)
             
             # Parse the code
-            self.parser = Parser(tokens)
-            ast = self.parser.parse()
+            parser = Parser(tokens)
+            ast = parser.parse()
             
             # Analyze the AST
             self.analyze_ast(ast, analysis)
             
         except Exception as e:
             analysis['parse_error'] = str(e)
-        
+
+        with self._analysis_cache_lock:
+            self._analysis_cache[h] = analysis
+            while len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
         return analysis
     
+    # Control-flow statements only bump the complexity counter; they are
+    # counted inline in the walk loop rather than through a handler call
+    _COMPLEXITY_NODE_TYPES = frozenset((
+        NodeTypeId.IF_STATEMENT.value,
+        NodeTypeId.FOR_STATEMENT.value,
+        NodeTypeId.WHILE_STATEMENT.value,
+        NodeTypeId.DO_WHILE_STATEMENT.value,
+    ))
+
     def analyze_ast(self, node: ASTNode, analysis: Dict):
-        """Recursively analyze AST nodes"""
-        if node.node_type == "FUNCTION_DEFINITION":
-            func_name = "unknown"
-            if node.children and len(node.children) > 0:
-                if node.children[0].node_type == "FUNCTION_DECLARATOR":
-                    func_name = node.children[0].value
-            
-            analysis['functions'].append({
-                'name': func_name,
-                'type': node.value,
-                'parameters': self.extract_parameters(node),
-                'has_body': True
-            })
-            analysis['complexity'] += 1
-            
-        elif node.node_type == "FUNCTION_DECLARATION":
-            func_name = "unknown"
-            if node.children and len(node.children) > 0:
-                if node.children[0].node_type == "FUNCTION_DECLARATOR":
-                    func_name = node.children[0].value
-            
-            analysis['functions'].append({
-                'name': func_name,
-                'type': node.value,
-                'parameters': self.extract_parameters(node),
-                'has_body': False
-            })
-            
-        elif node.node_type == "VARIABLE_DECLARATION":
-            var_name = "unknown"
-            if node.children and len(node.children) > 0:
-                if node.children[0].node_type == "VARIABLE_DECLARATOR":
-                    var_name = node.children[0].value
-            
-            analysis['variables'].append({
-                'name': var_name,
-                'type': node.value
-            })
-            
-        elif node.node_type == "INCLUDE":
-            analysis['includes'].append(node.value)
-            
-        elif node.node_type == "DEFINE":
-            analysis['defines'].append({
-                'name': node.value,
-                'value': node.children[0].value if node.children else None
-            })
-            
-        elif node.node_type == "STRUCT_DEFINITION":
-            analysis['structures'].append({
-                'name': node.value,
-                'members': len(node.children)
-            })
-            
-        elif node.node_type == "COMMENT":
-            analysis['comments'].append(node.value)
-            
-        elif node.node_type in ["IF_STATEMENT", "FOR_STATEMENT", "WHILE_STATEMENT", "DO_WHILE_STATEMENT"]:
-            analysis['complexity'] += 1
-        
-        # Recursively analyze children
-        for child in node.children:
-            self.analyze_ast(child, analysis)
+        """Analyze AST nodes iteratively via a handler table
+
+        An explicit stack avoids both RecursionError on deep trees and a
+        Python frame per node; the dict lookup replaces a string-compare
+        cascade per node. Hot names are bound to locals and the very
+        common control-flow nodes are tallied without a handler call,
+        flushing one total into the analysis dict at the end.
+        """
+        handlers_get = self._ast_handlers.get
+        complexity_types = self._COMPLEXITY_NODE_TYPES
+        stack = [node]
+        pop = stack.pop
+        extend = stack.extend
+        branches = 0
+        while stack:
+            n = pop()
+            t = n.node_type_id
+            if t in complexity_types:
+                branches += 1
+            else:
+                handler = handlers_get(t)
+                if handler:
+                    handler(n, analysis)
+            # Reversed so siblings are visited in source order off the stack
+            extend(reversed(n.children))
+        analysis['complexity'] += branches
+
+    def _analyze_function_definition(self, node: ASTNode, analysis: Dict):
+        func_name = "unknown"
+        if node.children and node.children[0].node_type == "FUNCTION_DECLARATOR":
+            func_name = node.children[0].value
+
+        analysis['functions'].append({
+            'name': func_name,
+            'type': node.value,
+            'parameters': self.extract_parameters(node),
+            'has_body': True
+        })
+        analysis['complexity'] += 1
+
+    def _analyze_function_declaration(self, node: ASTNode, analysis: Dict):
+        func_name = "unknown"
+        if node.children and node.children[0].node_type == "FUNCTION_DECLARATOR":
+            func_name = node.children[0].value
+
+        analysis['functions'].append({
+            'name': func_name,
+            'type': node.value,
+            'parameters': self.extract_parameters(node),
+            'has_body': False
+        })
+
+    def _analyze_variable_declaration(self, node: ASTNode, analysis: Dict):
+        var_name = "unknown"
+        if node.children and node.children[0].node_type == "VARIABLE_DECLARATOR":
+            var_name = node.children[0].value
+
+        analysis['variables'].append({
+            'name': var_name,
+            'type': node.value
+        })
+
+    def _analyze_include(self, node: ASTNode, analysis: Dict):
+        analysis['includes'].append(node.value)
+
+    def _analyze_define(self, node: ASTNode, analysis: Dict):
+        analysis['defines'].append({
+            'name': node.value,
+            'value': node.children[0].value if node.children else None
+        })
+
+    def _analyze_struct_definition(self, node: ASTNode, analysis: Dict):
+        analysis['structures'].append({
+            'name': node.value,
+            'members': len(node.children)
+        })
+
+    def _analyze_comment(self, node: ASTNode, analysis: Dict):
+        analysis['comments'].append(node.value)
     
     def extract_parameters(self, node: ASTNode) -> List[Dict]:
         """Extract function parameters from AST node"""
-        parameters = []
-        if node.children and len(node.children) > 0:
-            declarator = node.children[0]
-            if declarator.node_type == "FUNCTION_DECLARATOR" and declarator.children:
-                for param in declarator.children:
-                    if param.node_type == "PARAMETER":
-                        param_info = {
-                            'type': param.value,
-                            'name': param.children[0].value if param.children else None
-                        }
-                        parameters.append(param_info)
-        return parameters
+        children = node.children
+        if not children:
+            return []
+        declarator = children[0]
+        if declarator.node_type != "FUNCTION_DECLARATOR":
+            return []
+        return [
+            {
+                'type': param.value,
+                'name': param.children[0].value if param.children else None
+            }
+            for param in declarator.children
+            if param.node_type == "PARAMETER"
+        ]
     
     def compile_code(self, c_file_path: str, exe_path: str) -> Dict:
         """Compile C code using GCC"""
@@ -203,7 +422,7 @@ class CCompiler:
         }
         
         try:
-            # Compile with GCC
+            # Compile with GCC (through ccache when available)
             cmd = [
                 'gcc',
                 '-o', exe_path,
@@ -213,97 +432,197 @@ class CCompiler:
                 '-std=c99',  # Use C99 standard
                 '-lm'  # Link math library
             ]
-            
+            if self.ccache_path:
+                cmd.insert(0, self.ccache_path)
+
+            # Stream stderr as gcc produces it instead of buffering the
+            # whole diagnostic output and splitting it afterwards
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=self.compile_env
+            )
+            try:
+                self._classify_diagnostics(process.stderr, result)
+                returncode = process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+
+            if returncode == 0:
+                result['success'] = True
+                result['errors'] = []
+                result['warnings'] = []
+
+        except subprocess.TimeoutExpired:
+            result['errors'].append("Compilation timeout - code may be too complex or contain infinite loops")
+        except FileNotFoundError:
+            result['errors'].append("GCC compiler not found. Please install GCC to compile C code.")
+        except Exception as e:
+            result['errors'].append(f"Compilation error: {str(e)}")
+
+        return result
+
+    def compile_source(self, source_code: str, exe_path: str) -> Dict:
+        """Compile C source piped to GCC over stdin, skipping the temp .c file"""
+        result = {
+            'success': False,
+            'errors': [],
+            'warnings': []
+        }
+
+        try:
+            # '-x c -' makes gcc read the source from stdin; '-pipe' keeps the
+            # preprocessor/compiler stages off disk as well. ccache cannot
+            # cache stdin compiles, so it is not used here - the in-process
+            # exe cache already covers identical repeats.
+            #
+            # This is the fast run path: warnings are suppressed ('-w') and
+            # hardening that throwaway sandboxed binaries don't need is
+            # disabled; lint_source provides the full diagnostics on demand.
+            # PIE/PLT indirection and linker symbol sorting buy nothing for
+            # throwaway binaries, so they are disabled on the run path too
+            cmd = [
+                'gcc',
+                '-pipe',
+                '-O0',
+                '-w',  # No warnings on the run path
+                '-no-pie',
+                '-fno-pie',
+                '-fno-plt',
+                '-fno-asynchronous-unwind-tables',
+                '-fno-stack-protector',
+                '-Wl,--hash-style=gnu',
+                '-Wl,--as-needed',
+                '-x', 'c', '-',
+                '-o', exe_path,
+                '-std=c99'  # Use C99 standard
+            ]
+            if 'math.h' in source_code:
+                cmd.append('-lm')  # Link math library only when used
+
             process = subprocess.run(
                 cmd,
+                input=source_code,
                 capture_output=True,
                 text=True,
                 timeout=30
             )
-            
+
             if process.returncode == 0:
                 result['success'] = True
             else:
-                # Parse compiler errors and warnings
-                output_lines = process.stderr.split('\n')
-                
-                for line in output_lines:
-                    if line.strip():
-                        if 'warning:' in line.lower():
-                            result['warnings'].append(line.strip())
-                        elif 'error:' in line.lower():
-                            result['errors'].append(line.strip())
-                        else:
-                            # Treat unknown messages as errors
-                            result['errors'].append(line.strip())
-                            
+                self._classify_diagnostics(process.stderr.splitlines(), result)
+
         except subprocess.TimeoutExpired:
             result['errors'].append("Compilation timeout - code may be too complex or contain infinite loops")
         except FileNotFoundError:
             result['errors'].append("GCC compiler not found. Please install GCC to compile C code.")
         except Exception as e:
             result['errors'].append(f"Compilation error: {str(e)}")
-        
+
         return result
-    
+
+    def lint_source(self, source_code: str) -> Dict:
+        """Collect -Wall/-Wextra diagnostics without generating code"""
+        result = {
+            'errors': [],
+            'warnings': []
+        }
+
+        try:
+            # -fsyntax-only stops after the front end, so this is much
+            # cheaper than a full compile even with all warnings enabled
+            cmd = [
+                'gcc',
+                '-fsyntax-only',
+                '-Wall',
+                '-Wextra',
+                '-std=c99',
+                '-x', 'c', '-'
+            ]
+
+            process = subprocess.run(
+                cmd,
+                input=source_code,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            self._classify_diagnostics(process.stderr.splitlines(), result)
+
+        except subprocess.TimeoutExpired:
+            result['errors'].append("Compilation timeout - code may be too complex or contain infinite loops")
+        except FileNotFoundError:
+            result['errors'].append("GCC compiler not found. Please install GCC to compile C code.")
+        except Exception as e:
+            result['errors'].append(f"Compilation error: {str(e)}")
+
+        return result
+
+    def _classify_diagnostics(self, stderr_lines, result: Dict):
+        """Sort compiler stderr lines into errors and warnings
+
+        Accepts any iterable of lines, including a live pipe, so callers
+        can classify while the compiler is still running.
+        """
+        warnings_append = result['warnings'].append
+        errors_append = result['errors'].append
+        for line in stderr_lines:
+            line = line.strip()
+            if line:
+                if 'warning:' in line.lower():
+                    warnings_append(line)
+                else:
+                    # Unknown messages are treated as errors too
+                    errors_append(line)
+
     def run_program(self, exe_path: str) -> Dict:
         """Run the compiled C program"""
+        return self._run_exe(exe_path)
+
+    def _run_exe(self, exe_path: str, program_input: Optional[str] = None) -> Dict:
+        """Spawn a compiled program with a minimal environment
+
+        User programs only need PATH and locale vars; passing a stripped
+        environment keeps the execve argument block small and avoids
+        leaking the server's environment into sandboxed code.
+        """
         result = {
             'output': '',
             'error': ''
         }
-        
+
         try:
-            
             process = subprocess.run(
                 [exe_path],
+                input=program_input,
                 capture_output=True,
                 text=True,
-                timeout=10  # 10 second timeout
+                timeout=10,  # 10 second timeout
+                env=self._run_env
             )
-            
+
             result['output'] = process.stdout
             if process.stderr:
                 result['error'] = process.stderr
-                
+
         except subprocess.TimeoutExpired:
             result['error'] = "Program execution timeout - possible infinite loop"
         except Exception as e:
             result['error'] = f"Runtime error: {str(e)}"
-        
+
         return result
     
     def _detect_interactive_input(self, source_code: str) -> bool:
         """Check if the source code requires interactive input"""
-        # Check for common input functions
-        input_functions = [
-            'scanf(', 'gets(', 'fgets(', 'getchar(', 'getc(',
-            'read(', 'fread(', 'getline('
-        ]
-        
-        source_lower = source_code.lower()
-        
-        for func in input_functions:
-            if func in source_lower:
-                return True
-        
-        # Check for specific patterns that indicate user input
-        patterns = [
-            r'scanf\s*\(',
-            r'gets\s*\(',
-            r'fgets\s*\(',
-            r'getchar\s*\(',
-            r'getc\s*\(',
-            r'read\s*\(',
-            r'fread\s*\(',
-            r'getline\s*\('
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, source_code, re.IGNORECASE):
-                return True
-        
-        return False
+        if self._INPUT_RE.search(source_code.encode('ascii', 'ignore')):
+            return True
+        return self._INPUT_RE_CI.search(source_code) is not None
     
     def _run_with_input(self, source_code: str, program_input: str) -> Dict:
         """Run C program with provided input"""
@@ -316,161 +635,110 @@ class CCompiler:
         }
         
         try:
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.c', delete=False) as c_file:
-                c_file.write(source_code)
-                c_file_path = c_file.name
-            
-            exe_path = c_file_path.replace('.c', '.exe')
-            
-            # Compile the code
-            compile_result = self.compile_code(c_file_path, exe_path)
-            
+            # Reuse a previously compiled executable for identical source
+            key = self._exe_cache_key(source_code)
+            exe_path = self._get_cached_exe(key)
+            if exe_path:
+                run_result = self.run_program_with_input(exe_path, program_input)
+                result['output'] = run_result['output']
+                result['success'] = True
+                return result
+
+            exe_path = os.path.join(self._exe_cache_dir, key.hex() + '.exe')
+
+            # Compile the code (source piped over stdin, no temp .c file)
+            compile_result = self.compile_source(source_code, exe_path)
+
             if compile_result['success']:
-                # Run the compiled program with input
+                # Run the compiled program with input and keep the exe
+                self._store_cached_exe(key, exe_path)
                 run_result = self.run_program_with_input(exe_path, program_input)
                 result['output'] = run_result['output']
                 result['success'] = True
             else:
                 result['errors'] = compile_result['errors']
                 result['warnings'] = compile_result['warnings']
-            
-            # Clean up temporary files
-            try:
-                os.unlink(c_file_path)
-                if os.path.exists(exe_path):
-                    os.unlink(exe_path)
-            except:
-                pass
-                
+
         except Exception as e:
             result['errors'].append(f"Compiler Error: {str(e)}")
-        
+
         return result
     
     def run_program_with_input(self, exe_path: str, program_input: str) -> Dict:
         """Run the compiled C program with input"""
-        result = {
-            'output': '',
-            'error': ''
-        }
-        
-        try:
-            process = subprocess.run(
-                [exe_path],
-                input=program_input,
-                capture_output=True,
-                text=True,
-                timeout=10  # 10 second timeout
-            )
-            
-            result['output'] = process.stdout
-            if process.stderr:
-                result['error'] = process.stderr
-                
-        except subprocess.TimeoutExpired:
-            result['error'] = "Program execution timeout - possible infinite loop"
-        except Exception as e:
-            result['error'] = f"Runtime error: {str(e)}"
-        
-        return result
+        return self._run_exe(exe_path, program_input)
     
     def generate_code_explanation(self, analysis: Dict) -> str:
         """Generate human-readable explanation of the C code"""
-        explanation = []
-        
-        explanation.append("## C Code Analysis")
-        
+        # A single growable StringIO buffer replaces the append-then-join
+        # list; each former list entry is written with its leading newline
+        buf = io.StringIO()
+        w = buf.write
+
+        w("## C Code Analysis")
+
         # Program structure
-        explanation.append(f"\n### Program Structure")
-        explanation.append(f"- **Total Lines**: {analysis['lines']}")
-        explanation.append(f"- **Cyclomatic Complexity**: {analysis['complexity']}")
-        
+        w("\n\n### Program Structure")
+        w(f"\n- **Total Lines**: {analysis['lines']}")
+        w(f"\n- **Cyclomatic Complexity**: {analysis['complexity']}")
+
         # Functions
         if analysis['functions']:
-            explanation.append(f"\n### Functions ({len(analysis['functions'])})")
+            w(f"\n\n### Functions ({len(analysis['functions'])})")
             for func in analysis['functions']:
-                explanation.append(f"- **{func['name']}** (returns {func['type']})")
+                w(f"\n- **{func['name']}** (returns {func['type']})")
                 if func['parameters']:
-                    params = ", ".join([f"{p['type']} {p['name']}" for p in func['parameters']])
-                    explanation.append(f"  - Parameters: {params}")
-                explanation.append(f"  - Has implementation: {'Yes' if func['has_body'] else 'No'}")
-        
+                    params = ", ".join(f"{p['type']} {p['name']}" for p in func['parameters'])
+                    w(f"\n  - Parameters: {params}")
+                w(f"\n  - Has implementation: {'Yes' if func['has_body'] else 'No'}")
+
         # Variables
         if analysis['variables']:
-            explanation.append(f"\n### Variables ({len(analysis['variables'])})")
-            for var in analysis['variables']:
-                explanation.append(f"- **{var['name']}** ({var['type']})")
-        
+            w(f"\n\n### Variables ({len(analysis['variables'])})")
+            w("".join(f"\n- **{var['name']}** ({var['type']})" for var in analysis['variables']))
+
         # Includes
         if analysis['includes']:
-            explanation.append(f"\n### Header Files ({len(analysis['includes'])})")
-            for include in analysis['includes']:
-                explanation.append(f"- `{include}`")
-        
+            w(f"\n\n### Header Files ({len(analysis['includes'])})")
+            w("".join(f"\n- `{include}`" for include in analysis['includes']))
+
         # Defines
         if analysis['defines']:
-            explanation.append(f"\n### Preprocessor Definitions ({len(analysis['defines'])})")
+            w(f"\n\n### Preprocessor Definitions ({len(analysis['defines'])})")
             for define in analysis['defines']:
                 if define['value']:
-                    explanation.append(f"- `{define['name']}` = `{define['value']}`")
+                    w(f"\n- `{define['name']}` = `{define['value']}`")
                 else:
-                    explanation.append(f"- `{define['name']}`")
-        
+                    w(f"\n- `{define['name']}`")
+
         # Structures
         if analysis['structures']:
-            explanation.append(f"\n### Structures ({len(analysis['structures'])})")
-            for struct in analysis['structures']:
-                explanation.append(f"- **{struct['name']}** ({struct['members']} members)")
-        
+            w(f"\n\n### Structures ({len(analysis['structures'])})")
+            w("".join(f"\n- **{struct['name']}** ({struct['members']} members)" for struct in analysis['structures']))
+
         # Comments
         if analysis['comments']:
-            explanation.append(f"\n### Comments ({len(analysis['comments'])})")
-            for comment in analysis['comments'][:5]:  # Show first 5 comments
-                explanation.append(f"- `{comment}`")
+            w(f"\n\n### Comments ({len(analysis['comments'])})")
+            w("".join(f"\n- `{comment}`" for comment in analysis['comments'][:5]))  # Show first 5 comments
             if len(analysis['comments']) > 5:
-                explanation.append(f"- ... and {len(analysis['comments']) - 5} more")
-        
-        return "\n".join(explanation)
+                w(f"\n- ... and {len(analysis['comments']) - 5} more")
+
+        return buf.getvalue()
     
     def generate_error_explanation(self, errors: List[str]) -> str:
         """Generate detailed explanation of compilation errors"""
-        explanation = []
-        
-        explanation.append("## Compilation Error Analysis")
-        
+        buf = io.StringIO()
+        w = buf.write
+        err_re = self._ERR_RE
+        templates = self._ERR_TEMPLATES
+
+        w("## Compilation Error Analysis")
+
         for error in errors:
-            explanation.append(f"\n### Error: `{error}`")
-            
-            # Common error patterns and explanations
-            if "undefined reference to" in error.lower():
-                explanation.append("- **Type**: Linker Error")
-                explanation.append("- **Cause**: Function or variable is used but not defined")
-                explanation.append("- **Solution**: Implement the missing function or include the correct header")
-                
-            elif "expected" in error.lower() and "before" in error.lower():
-                explanation.append("- **Type**: Syntax Error")
-                explanation.append("- **Cause**: Missing semicolon, bracket, or other syntax element")
-                explanation.append("- **Solution**: Check the line mentioned and add missing syntax")
-                
-            elif "implicit declaration" in error.lower():
-                explanation.append("- **Type**: Function Declaration Error")
-                explanation.append("- **Cause**: Function is used without being declared")
-                explanation.append("- **Solution**: Add function prototype or include appropriate header")
-                
-            elif "unused variable" in error.lower():
-                explanation.append("- **Type**: Warning")
-                explanation.append("- **Cause**: Variable is declared but never used")
-                explanation.append("- **Solution**: Remove unused variable or use it in your code")
-                
-            elif "control reaches end" in error.lower():
-                explanation.append("- **Type**: Warning")
-                explanation.append("- **Cause**: Function doesn't return a value in all code paths")
-                explanation.append("- **Solution**: Add return statement or ensure all paths return a value")
-                
-            else:
-                explanation.append("- **Type**: Compilation Error")
-                explanation.append("- **Cause**: Syntax or semantic error in the code")
-                explanation.append("- **Solution**: Review the error message and fix the indicated issue")
-        
-        return "\n".join(explanation) 
\ No newline at end of file
+            w(f"\n\n### Error: `{error}`")
+            # One regex pass picks the diagnostic category; the matching
+            # named group keys the pre-built explanation template
+            m = err_re.search(error)
+            w(templates[m.lastgroup if m else None])
+
+        return buf.getvalue() 
\ No newline at end of file
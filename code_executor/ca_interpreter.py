@@ -1,65 +1,229 @@
+import operator
 import re
+import sys
+from collections import namedtuple
 
 class CAInterpreterError(Exception):
     pass
 
+# Lightweight token / expression-node records; attribute access on a
+# namedtuple is a single C-level op and each record is far smaller than
+# the dicts they replace
+Tok = namedtuple('Tok', ('type', 'value'))
+CallNode = namedtuple('CallNode', ('type', 'name', 'args'))
+ArrayNode = namedtuple('ArrayNode', ('type', 'elements'))
+BinopNode = namedtuple('BinopNode', ('type', 'op', 'left', 'right'))
+LocalNode = namedtuple('LocalNode', ('type', 'slot', 'name'))
+ConstNode = namedtuple('ConstNode', ('type', 'value'))
+
+_CACHE_MISS = object()  # Sentinel distinguishing 'not cached' from a cached None
+
+# Operators a numeric-only function may use and still be lowered to Python
+_JIT_OPS = frozenset(('+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>='))
+
+class _NotNumeric(Exception):
+    # Internal signal: function body uses something outside the numeric subset
+    pass
+
+class _FuncScope:
+    """Call scope backed by a flat slot frame for the function's locals.
+
+    Locals resolve to list indices at parse time; only names that are not
+    locals fall through to the caller's scope by name, preserving the old
+    dict-copy inheritance without copying anything.
+    """
+    __slots__ = ('slots', 'frame', 'outer')
+
+    def __init__(self, slots, frame, outer):
+        self.slots = slots
+        self.frame = frame
+        self.outer = outer
+
+    def get(self, name, default=None):
+        slot = self.slots.get(name)
+        if slot is not None and self.frame[slot] is not None:
+            return self.frame[slot]
+        return self.outer.get(name, default)
+
+# Binary operators as C-level callables: one dict probe replaces up to
+# eleven string comparisons per evaluated operator
+_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+# Built-in functions as (arity, required arg types or None, callable);
+# one dict probe and one argspec check replace the old elif chain
+_BUILTINS = {
+    'to_lower': (1, (str,), lambda a: a[0].lower()),
+    'replace_char': (3, (str, str, str), lambda a: a[0].replace(a[1], a[2])),
+    'reverse': (1, (str,), lambda a: a[0][::-1]),
+    'len': (1, None, lambda a: len(a[0])),
+    'sum': (1, (list,), lambda a: sum(a[0])),
+    'max': (1, (list,), lambda a: max(a[0])),
+    'min': (1, (list,), lambda a: min(a[0])),
+}
+
+_BUILTIN_USAGE = {
+    'to_lower': 'to_lower expects one string argument.',
+    'replace_char': 'replace_char expects three string arguments (text, old, new).',
+    'reverse': 'reverse expects one string argument.',
+    'len': 'len expects one argument.',
+    'sum': 'sum expects one array argument.',
+    'max': 'max expects one array argument.',
+    'min': 'min expects one array argument.',
+}
+
+# Token types that close an implicit block / end a function body
+_BLOCK_TERMINATORS = frozenset(('ELSE', 'FUNC', 'MAIN'))
+_BODY_TERMINATORS = frozenset(('FUNC', 'MAIN'))
+
+# Binding power for precedence climbing; higher binds tighter
+_PREC = {
+    '*': 7, '/': 7, '%': 7,
+    '+': 6, '-': 6,
+    '<': 5, '>': 5, '<=': 5, '>=': 5,
+    '==': 4, '!=': 4,
+}
+
+def _strip_comments(code):
+    """Remove # comments in one forward scan, leaving string literals alone.
+
+    Sources without a '#' return unchanged; otherwise non-comment runs are
+    sliced out and joined once, and newlines are kept so token positions
+    stay meaningful.
+    """
+    if '#' not in code:
+        return code
+    parts = []
+    append = parts.append
+    find = code.find
+    start = 0
+    in_string = False
+    i = 0
+    n = len(code)
+    while i < n:
+        ch = code[i]
+        if in_string:
+            if ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '#':
+            append(code[start:i])
+            i = find('\n', i)
+            if i == -1:
+                start = n
+                break
+            start = i # Keep the newline itself
+        i += 1
+    append(code[start:])
+    return ''.join(parts)
+
+# All token patterns fused into one alternation compiled at import time;
+# m.lastgroup names the token class, so each position costs one regex step
+# instead of up to six sequential match attempts
+# Interned type tags: comparing two interned strings hits CPython's
+# pointer-equality fast path before any character scan
+NUMBER = sys.intern('NUMBER')
+STRING = sys.intern('STRING')
+IDENTIFIER = sys.intern('IDENTIFIER')
+OPERATOR_OR_SEPARATOR = sys.intern('OPERATOR_OR_SEPARATOR')
+TRUE = sys.intern('TRUE')
+FALSE = sys.intern('FALSE')
+CALL = sys.intern('CALL')
+ARRAY_LITERAL = sys.intern('ARRAY_LITERAL')
+BINOP = sys.intern('BINOP')
+LOCAL = sys.intern('LOCAL')
+CONST = sys.intern('CONST')
+
+# Keyword -> token type, resolved with one dict probe instead of a linear
+# scan over a keyword list for every identifier
+_KEYWORDS = {kw: sys.intern(kw.upper()) for kw in (
+    'func', 'return', 'if', 'else', 'loop', 'true', 'false', 'main', 'print')}
+
+_MASTER_RE = re.compile(
+    r'(?P<STRING>"[^"]*")'
+    r'|(?P<NUMBER>\d+)'
+    r'|(?P<IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)'
+    r'|(?P<OPERATOR_OR_SEPARATOR>==|!=|<=|>=|[<>=+\-*/%:()\[\],])'
+    r'|(?P<COMMENT>#.*)'  # Comments start with #
+    r'|(?P<SKIP>\s+)'  # Whitespace, ignore
+    r'|(?P<MISMATCH>.)'  # Anything else is a lexer error
+)
+
 class CAInterpreter:
-    def __init__(self):
+    def __init__(self, memoize_calls=False):
         self.variables = {}
         self.functions = {}
         self.output_buffer = []
+        # Opt-in: memoizing calls turns exponential recursive workloads
+        # polynomial. Only functions whose results depend solely on their
+        # arguments are cached; _resolve_local_slots marks anything that
+        # prints or reads the enclosing scope (directly or via a callee)
+        # as non-memoizable. Off by default to avoid taxing programs that
+        # never repeat a call
+        self.memoize_calls = memoize_calls
+        self._call_cache = {}
+        self._jit_funcs = {}
+        self._expr_handlers = {
+            'CONST': self._eval_const,
+            'IDENTIFIER': self._eval_identifier,
+            'LOCAL': self._eval_local,
+            'CALL': self._eval_call,
+            'ARRAY_LITERAL': self._eval_array_literal,
+            'BINOP': self._eval_binop,
+        }
+        self._stmt_handlers = {
+            'ASSIGN': self._exec_assign,
+            'ASSIGN_LOCAL': self._exec_assign_local,
+            'PRINT': self._exec_print,
+            'RETURN': self._exec_return,
+            'CALL_STATEMENT': self._exec_call_stmt,
+            'IF': self._exec_if,
+            'LOOP': self._exec_loop,
+        }
 
     def _reset(self):
         self.variables = {}
         self.functions = {}
         self.output_buffer = []
+        self._call_cache.clear()
+        self._jit_funcs = {}
 
     def _tokenize(self, code):
         # Very basic tokenizer: separates keywords, identifiers, numbers, operators, strings
         # This is a highly simplified tokenizer. Real tokenizers use more robust regex or tools like PLY.
         tokens = []
-        # Regex for strings (simple: anything between double quotes)
-        # numbers (integers only for simplicity)
-        # identifiers/keywords
-        # operators/separators
-        token_patterns = [
-            (r'"[^"]*"', 'STRING'),
-            (r'\d+', 'NUMBER'),
-            (r'[a-zA-Z_][a-zA-Z0-9_]*', 'IDENTIFIER'),
-            (r'==|!=|<=|>=|<|>|=|\+|-|\*|/|%|:|\(|\)|\[|\]|,', 'OPERATOR_OR_SEPARATOR'),
-            (r'#.*', 'COMMENT'), # Comments start with #
-            (r'\s+', None) # Whitespace, ignore
-        ]
-
-        # Flatten code into single line, remove comments
-        lines = code.split('\n')
-        processed_lines = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith('#') or not line:
-                continue # Skip comments and empty lines
-            processed_lines.append(line)
-        code = "\n".join(processed_lines)
-
-        position = 0
-        while position < len(code):
-            match = None
-            for pattern, token_type in token_patterns:
-                regex = re.compile(pattern)
-                m = regex.match(code, position)
-                if m:
-                    if token_type: # Ignore whitespace
-                        value = m.group(0)
-                        if token_type == 'IDENTIFIER':
-                            # Check for keywords
-                            if value in ['func', 'return', 'if', 'else', 'loop', 'true', 'false', 'main', 'print']:
-                                token_type = value.upper()
-                        tokens.append({'type': token_type, 'value': value})
-                    position = m.end()
-                    match = True
-                    break
-            if not match:
-                raise CAInterpreterError(f"Lexer error: Unexpected character '{code[position]}' at position {position}")
+
+        # Remove comments in one pass; the SKIP pattern swallows blank lines
+        code = _strip_comments(code)
+
+        append = tokens.append
+        keyword_get = _KEYWORDS.get
+        intern = sys.intern
+        for m in _MASTER_RE.finditer(code):
+            token_type = m.lastgroup
+            if token_type == 'SKIP':  # Ignore whitespace
+                continue
+            value = m.group()
+            if token_type == 'MISMATCH':
+                raise CAInterpreterError(f"Lexer error: Unexpected character '{value}' at position {m.start()}")
+            if token_type == 'IDENTIFIER':
+                # Check for keywords
+                token_type = keyword_get(value, IDENTIFIER)
+            else:
+                token_type = intern(token_type)
+            append(Tok(token_type, value))
         return tokens
 
     def _parse(self, tokens):
@@ -77,54 +241,77 @@ class CAInterpreter:
             if current_token_index >= len(tokens):
                 raise CAInterpreterError("Parser error: Unexpected end of input.")
             token = tokens[current_token_index]
-            if expected_type and token['type'] != expected_type:
-                raise CAInterpreterError(f"Parser error: Expected token type '{expected_type}', got '{token['type']}' ('{token['value']}')")
-            if expected_value and token['value'] != expected_value:
-                 raise CAInterpreterError(f"Parser error: Expected token value '{expected_value}', got '{token['value']}'")
+            if expected_type and token.type != expected_type:
+                raise CAInterpreterError(f"Parser error: Expected token type '{expected_type}', got '{token.type}' ('{token.value}')")
+            if expected_value and token.value != expected_value:
+                 raise CAInterpreterError(f"Parser error: Expected token value '{expected_value}', got '{token.value}'")
             current_token_index += 1
             return token
 
-        def parse_expression():
-            # Simplistic: handles identifiers, numbers, strings, basic arithmetic, comparisons
-            # Does not handle operator precedence or complex nested expressions
-            parts = []
-            while peek() and peek()['type'] not in ['OPERATOR_OR_SEPARATOR', 'COLON', 'IF', 'ELSE', 'LOOP', 'RETURN', 'END_OF_STATEMENT']:
-                token = peek()
-                if token['type'] in ['NUMBER', 'STRING', 'TRUE', 'FALSE', 'IDENTIFIER']:
-                    parts.append(consume())
-                elif token['value'] == '(': # Function call or parenthesized expression
+        def parse_atom():
+            # Primary expressions: literals, identifiers, calls, parens, arrays
+            token = peek()
+            if token is None:
+                return None
+            if token.type is NUMBER:
+                # Decode literals once at parse time; evaluation returns the
+                # ready Python value with no per-visit conversion
+                return ConstNode(CONST, int(consume().value))
+            if token.type is STRING:
+                return ConstNode(CONST, consume().value[1:-1])
+            if token.type is TRUE:
+                consume()
+                return ConstNode(CONST, True)
+            if token.type is FALSE:
+                consume()
+                return ConstNode(CONST, False)
+            if token.type == IDENTIFIER:
+                name_token = consume()
+                if peek() and peek().value == '(': # Function call
                     consume('OPERATOR_OR_SEPARATOR', '(')
-                    func_name = parts.pop()['value'] if parts else None # Assume last identifier was func name
                     args = []
-                    while peek() and peek()['value'] != ')':
-                        args.append(parse_expression()) # Recursive call for arguments
-                        if peek() and peek()['value'] == ',':
+                    while peek() and peek().value != ')':
+                        args.append(parse_expression())
+                        if peek() and peek().value == ',':
                             consume('OPERATOR_OR_SEPARATOR', ',')
                     consume('OPERATOR_OR_SEPARATOR', ')')
-                    parts.append({'type': 'CALL', 'name': func_name, 'args': args}) # Represent as a call node
-                elif token['value'] == '[': # Array access or definition
-                    # This is very rudimentary for array definition or access
-                    consume('OPERATOR_OR_SEPARATOR', '[')
-                    elements = []
-                    while peek() and peek()['value'] != ']':
-                        elements.append(parse_expression())
-                        if peek() and peek()['value'] == ',':
-                            consume('OPERATOR_OR_SEPARATOR', ',')
-                    consume('OPERATOR_OR_SEPARATOR', ']')
-                    parts.append({'type': 'ARRAY_LITERAL', 'elements': elements})
-                else:
+                    return CallNode(CALL, name_token.value, args)
+                return name_token
+            if token.value == '(': # Parenthesized expression
+                consume('OPERATOR_OR_SEPARATOR', '(')
+                expr = parse_expression()
+                consume('OPERATOR_OR_SEPARATOR', ')')
+                return expr
+            if token.value == '[': # Array literal
+                consume('OPERATOR_OR_SEPARATOR', '[')
+                elements = []
+                while peek() and peek().value != ']':
+                    elements.append(parse_expression())
+                    if peek() and peek().value == ',':
+                        consume('OPERATOR_OR_SEPARATOR', ',')
+                consume('OPERATOR_OR_SEPARATOR', ']')
+                return ArrayNode(ARRAY_LITERAL, elements)
+            return None
+
+        def parse_expression(min_prec=0):
+            # Precedence climbing: builds a proper expression tree in one
+            # pass so the evaluator walks each node exactly once
+            left = parse_atom()
+            if left is None:
+                return None
+            while True:
+                token = peek()
+                if token is None or token.type is not OPERATOR_OR_SEPARATOR:
                     break
-            
-            # Simple handling of operators: assumes left-to-right, no precedence
-            while peek() and peek()['value'] in ['+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>=']:
-                op = consume('OPERATOR_OR_SEPARATOR')
-                right_operand = peek()
-                if right_operand and right_operand['type'] in ['NUMBER', 'STRING', 'TRUE', 'FALSE', 'IDENTIFIER']:
-                    parts.append(op)
-                    parts.append(consume())
-                else:
-                    break # Not a simple operand after operator
-            return parts
+                prec = _PREC.get(token.value)
+                if prec is None or prec < min_prec:
+                    break
+                op = consume().value
+                right = parse_expression(prec + 1)
+                if right is None:
+                    raise CAInterpreterError(f"Parser error: Expected expression after operator '{op}'")
+                left = BinopNode(BINOP, op, left, right)
+            return left
 
         def parse_statement():
             statement = {}
@@ -133,34 +320,34 @@ class CAInterpreter:
 
             token = peek()
 
-            if token['type'] == 'IDENTIFIER':
-                var_name = consume('IDENTIFIER')['value']
-                if peek() and peek()['value'] == '=':
+            if token.type == 'IDENTIFIER':
+                var_name = consume('IDENTIFIER').value
+                if peek() and peek().value == '=':
                     consume('OPERATOR_OR_SEPARATOR', '=')
                     value_parts = parse_expression()
                     statement = {'type': 'ASSIGN', 'name': var_name, 'value': value_parts}
-                elif peek() and peek()['value'] == '(': # Function call as a statement
+                elif peek() and peek().value == '(': # Function call as a statement
                     consume('OPERATOR_OR_SEPARATOR', '(')
                     args = []
-                    while peek() and peek()['value'] != ')':
+                    while peek() and peek().value != ')':
                         args.append(parse_expression())
-                        if peek() and peek()['value'] == ',':
+                        if peek() and peek().value == ',':
                             consume('OPERATOR_OR_SEPARATOR', ',')
                     consume('OPERATOR_OR_SEPARATOR', ')')
                     statement = {'type': 'CALL_STATEMENT', 'name': var_name, 'args': args}
                 else:
                     raise CAInterpreterError(f"Parser error: Expected '=' or '(' after identifier '{var_name}'")
-            elif token['type'] == 'PRINT':
+            elif token.type == 'PRINT':
                 consume('PRINT')
                 consume('OPERATOR_OR_SEPARATOR', '(')
                 expr = parse_expression()
                 consume('OPERATOR_OR_SEPARATOR', ')')
                 statement = {'type': 'PRINT', 'expression': expr}
-            elif token['type'] == 'RETURN':
+            elif token.type == 'RETURN':
                 consume('RETURN')
                 expr = parse_expression()
                 statement = {'type': 'RETURN', 'expression': expr}
-            elif token['type'] == 'IF':
+            elif token.type == 'IF':
                 consume('IF')
                 consume('OPERATOR_OR_SEPARATOR', '(')
                 condition = parse_expression()
@@ -168,12 +355,12 @@ class CAInterpreter:
                 consume('OPERATOR_OR_SEPARATOR', ':')
                 body = parse_block()
                 else_body = []
-                if peek() and peek()['type'] == 'ELSE':
+                if peek() and peek().type == 'ELSE':
                     consume('ELSE')
                     consume('OPERATOR_OR_SEPARATOR', ':')
                     else_body = parse_block()
                 statement = {'type': 'IF', 'condition': condition, 'body': body, 'else_body': else_body}
-            elif token['type'] == 'LOOP':
+            elif token.type == 'LOOP':
                 consume('LOOP')
                 consume('OPERATOR_OR_SEPARATOR', '(')
                 condition = parse_expression()
@@ -187,34 +374,32 @@ class CAInterpreter:
             return statement
 
         def parse_block():
+            # Blocks have no explicit delimiters in CA: collect statements
+            # until the next 'else', 'func' or 'main' keyword (or EOF) closes
+            # the block. Still brittle, but loop/if bodies actually execute.
             block_statements = []
-            # In a real language, indentation or explicit end markers would define a block.
-            # For simplicity, we'll assume a block continues until a new 'func', 'main', or end of file.
-            # This is extremely brittle. A robust parser needs proper block delimiters.
-            # For now, we'll try to collect statements until a 'func', 'main', 'else' or EOF.
-            # This requires careful token advance in parse_function and parse_main to not over-consume.
-            # For this simple example, we'll rely on the top-level loop for main block.
-            # For if/loop bodies, we'll stop when the next token implies end of block (e.g., 'else' or another 'func').
-            # This needs a better block definition in the language. Let's assume a simple structure for now.
-            # We'll use implicit block ending for now, requiring careful ordering of statements.
-            # A better approach would be explicit 'end' or indentation based parsing.
-            return [] # This will be handled implicitly by the main parse loop for now
+            while peek() and peek().type not in _BLOCK_TERMINATORS:
+                stmt = parse_statement()
+                if stmt is None:
+                    break
+                block_statements.append(stmt)
+            return block_statements
 
         def parse_function():
             consume('FUNC')
-            func_name = consume('IDENTIFIER')['value']
+            func_name = consume('IDENTIFIER').value
             consume('OPERATOR_OR_SEPARATOR', '(')
             params = []
-            if peek() and peek()['type'] == 'IDENTIFIER':
-                params.append(consume('IDENTIFIER')['value'])
-                while peek() and peek()['value'] == ',':
+            if peek() and peek().type == 'IDENTIFIER':
+                params.append(consume('IDENTIFIER').value)
+                while peek() and peek().value == ',':
                     consume('OPERATOR_OR_SEPARATOR', ',')
-                    params.append(consume('IDENTIFIER')['value'])
+                    params.append(consume('IDENTIFIER').value)
             consume('OPERATOR_OR_SEPARATOR', ')')
             consume('OPERATOR_OR_SEPARATOR', ':')
 
             body_statements = []
-            while peek() and peek()['type'] not in ['FUNC', 'MAIN']:
+            while peek() and peek().type not in _BODY_TERMINATORS:
                 stmt = parse_statement()
                 if stmt:
                     body_statements.append(stmt)
@@ -225,10 +410,11 @@ class CAInterpreter:
         # Main parsing loop
         while current_token_index < len(tokens):
             token = tokens[current_token_index]
-            if token['type'] == 'FUNC':
+            if token.type == 'FUNC':
                 func_node = parse_function()
+                self._resolve_local_slots(func_node)
                 ast['functions'][func_node['name']] = func_node
-            elif token['type'] == 'MAIN':
+            elif token.type == 'MAIN':
                 consume('MAIN')
                 consume('OPERATOR_OR_SEPARATOR', ':')
                 while current_token_index < len(tokens):
@@ -238,114 +424,255 @@ class CAInterpreter:
                     else: # If it's not a recognized statement, just advance for now (error or end of input)
                         current_token_index += 1 # Consume to prevent infinite loop on unknown tokens
             else:
-                raise CAInterpreterError(f"Parser error: Unexpected token at top level '{token['value']}'")
+                raise CAInterpreterError(f"Parser error: Unexpected token at top level '{token.value}'")
         return ast
 
-    def _evaluate_expression(self, expression_parts, scope):
-        # This is extremely simplified and does not handle operator precedence
-        # or complex nesting. It evaluates left-to-right.
-        if not expression_parts:
-            return None
-
-        # Handle single token expressions (literals, variables, true/false)
-        if len(expression_parts) == 1:
-            token = expression_parts[0]
-            if token['type'] == 'NUMBER':
-                return int(token['value'])
-            elif token['type'] == 'STRING':
-                return token['value'].strip('"')
-            elif token['type'] == 'TRUE':
-                return True
-            elif token['type'] == 'FALSE':
-                return False
-            elif token['type'] == 'IDENTIFIER':
-                val = scope.get(token['value'], self.variables.get(token['value']))
-                if val is None:
-                    raise CAInterpreterError(f"Runtime error: Undefined variable '{token['value']}'")
-                return val
-            elif token['type'] == 'CALL':
-                return self._execute_call(token, scope)
-            elif token['type'] == 'ARRAY_LITERAL':
-                return [self._evaluate_expression([elem], scope) for elem in token['elements']]
-            else:
-                raise CAInterpreterError(f"Runtime error: Cannot evaluate expression part of type {token['type']}")
-
-        # Handle simple binary operations (left-to-right)
-        # This is a very primitive way to do this. A real parser would build an expression tree.
-        result = self._evaluate_expression([expression_parts[0]], scope)
-        i = 1
-        while i < len(expression_parts):
-            op_token = expression_parts[i]
-            if op_token['type'] != 'OPERATOR_OR_SEPARATOR':
-                raise CAInterpreterError(f"Runtime error: Expected operator, got {op_token['type']}")
-            
-            operand2 = self._evaluate_expression([expression_parts[i+1]], scope)
-            op = op_token['value']
-
-            if op == '+':
-                result += operand2
-            elif op == '-':
-                result -= operand2
-            elif op == '*':
-                result *= operand2
-            elif op == '/':
-                if operand2 == 0:
-                    raise CAInterpreterError("Runtime error: Division by zero.")
-                result /= operand2
-            elif op == '%':
-                result %= operand2
-            elif op == '==':
-                result = (result == operand2)
-            elif op == '!=':
-                result = (result != operand2)
-            elif op == '<':
-                result = (result < operand2)
-            elif op == '>':
-                result = (result > operand2)
-            elif op == '<=':
-                result = (result <= operand2)
-            elif op == '>=':
-                result = (result >= operand2)
+    def _resolve_local_slots(self, func_node):
+        # Lower the function body in place: params and assigned names get
+        # integer slots, so runtime reads/writes are list indexing instead
+        # of two chained dict lookups per access
+        locals_map = {param: i for i, param in enumerate(func_node['params'])}
+        # Memoization safety is decided on this same walk: printing, bare
+        # call statements, or reading a name that is not a parameter/local
+        # make a call's result depend on more than its arguments, so such
+        # bodies must run on every call even when memoize_calls is on.
+        # Callee names are collected so interpret() can demote callers of
+        # non-memoizable functions too.
+        memoizable = True
+        called_names = set()
+
+        def collect(statements):
+            for st in statements:
+                stmt_type = st['type']
+                if stmt_type == 'ASSIGN':
+                    if st['name'] not in locals_map:
+                        locals_map[st['name']] = len(locals_map)
+                elif stmt_type == 'IF':
+                    collect(st['body'])
+                    collect(st['else_body'])
+                elif stmt_type == 'LOOP':
+                    collect(st['body'])
+
+        def rewrite_expr(node):
+            nonlocal memoizable
+            if node is None:
+                return None
+            node_type = node.type
+            if node_type is IDENTIFIER:
+                slot = locals_map.get(node.value)
+                if slot is not None:
+                    return LocalNode(LOCAL, slot, node.value)
+                memoizable = False  # Reads the enclosing scope
+                return node
+            if node_type is BINOP:
+                return BinopNode(BINOP, node.op, rewrite_expr(node.left), rewrite_expr(node.right))
+            if node_type is CALL:
+                called_names.add(node.name)
+                return CallNode(CALL, node.name, [rewrite_expr(a) for a in node.args])
+            if node_type is ARRAY_LITERAL:
+                return ArrayNode(ARRAY_LITERAL, [rewrite_expr(e) for e in node.elements])
+            return node
+
+        def rewrite(statements):
+            nonlocal memoizable
+            for st in statements:
+                stmt_type = st['type']
+                if stmt_type == 'ASSIGN':
+                    st['type'] = 'ASSIGN_LOCAL'
+                    st['slot'] = locals_map[st['name']]
+                    st['value'] = rewrite_expr(st['value'])
+                elif stmt_type == 'PRINT':
+                    memoizable = False
+                    st['expression'] = rewrite_expr(st['expression'])
+                elif stmt_type == 'RETURN':
+                    st['expression'] = rewrite_expr(st['expression'])
+                elif stmt_type == 'CALL_STATEMENT':
+                    memoizable = False
+                    st['args'] = [rewrite_expr(a) for a in st['args']]
+                elif stmt_type == 'IF':
+                    st['condition'] = rewrite_expr(st['condition'])
+                    rewrite(st['body'])
+                    rewrite(st['else_body'])
+                elif stmt_type == 'LOOP':
+                    st['condition'] = rewrite_expr(st['condition'])
+                    rewrite(st['body'])
+
+        collect(func_node['body'])
+        rewrite(func_node['body'])
+        func_node['locals_map'] = locals_map
+        func_node['n_slots'] = len(locals_map)
+        func_node['memoizable'] = memoizable
+        func_node['called_names'] = called_names
+
+    def _compile_numeric_funcs(self):
+        """Lower numeric-only user functions to real Python functions.
+
+        Functions whose bodies use only numbers, locals/params, arithmetic,
+        comparisons, if/loop/return/assign and calls to other numeric-only
+        functions are translated to Python source once and compiled, so hot
+        recursive or loop-heavy kernels run without tree-walking overhead.
+        Anything touching strings, arrays, print or outer-scope variables
+        stays on the interpreted path.
+        """
+        candidates = {}
+        for name, func_node in self.functions.items():
+            try:
+                candidates[name] = self._translate_function(name, func_node)
+            except _NotNumeric:
+                pass
+        # A function is only compilable if everything it calls is too
+        changed = True
+        while changed:
+            changed = False
+            for name in list(candidates):
+                if any(callee not in candidates for callee in candidates[name][1]):
+                    del candidates[name]
+                    changed = True
+        if not candidates:
+            return {}
+        namespace = {'_ca_print': self._jit_print}
+        source = '\n'.join('\n'.join(lines) for lines, _ in candidates.values())
+        exec(compile(source, '<ca-jit>', 'exec'), namespace)
+        return {name: namespace['_f_' + name] for name in candidates}
+
+    def _jit_print(self, val):
+        # print hook for lowered functions; mirrors _exec_print exactly
+        self.output_buffer.append(val if type(val) is str else str(val))
+
+    def _translate_function(self, name, func_node):
+        params = func_node['params']
+        called = set()
+        names_used = set()
+        assigned = set()
+
+        def emit_expr(node):
+            if node is None:
+                raise _NotNumeric
+            node_type = node.type
+            if node_type is CONST:
+                value = node.value
+                if value is True or value is False or isinstance(value, int):
+                    return repr(value)
+                raise _NotNumeric # String constant
+            if node_type is LOCAL:
+                names_used.add(node.name)
+                return '_v_' + node.name
+            if node_type is IDENTIFIER:
+                names_used.add(node.value)
+                return '_v_' + node.value
+            if node_type is BINOP:
+                if node.op not in _JIT_OPS:
+                    raise _NotNumeric
+                return f'({emit_expr(node.left)} {node.op} {emit_expr(node.right)})'
+            if node_type is CALL:
+                callee = self.functions.get(node.name)
+                if callee is None or len(node.args) != len(callee['params']):
+                    raise _NotNumeric
+                called.add(node.name)
+                return '_f_{}({})'.format(node.name, ', '.join(emit_expr(a) for a in node.args))
+            raise _NotNumeric # STRING, ARRAY_LITERAL, ...
+
+        def emit_block(statements, indent, out):
+            if not statements:
+                out.append('    ' * indent + 'pass')
+                return
+            for st in statements:
+                emit_stmt(st, indent, out)
+
+        def emit_stmt(st, indent, out):
+            pad = '    ' * indent
+            stmt_type = st['type']
+            if stmt_type in ('ASSIGN', 'ASSIGN_LOCAL'):
+                assigned.add(st['name'])
+                out.append(f"{pad}_v_{st['name']} = {emit_expr(st['value'])}")
+            elif stmt_type == 'RETURN':
+                expr = st['expression']
+                out.append(f"{pad}return {emit_expr(expr) if expr is not None else 'None'}")
+            elif stmt_type == 'IF':
+                out.append(f"{pad}if {emit_expr(st['condition'])}:")
+                emit_block(st['body'], indent + 1, out)
+                if st['else_body']:
+                    out.append(f"{pad}else:")
+                    emit_block(st['else_body'], indent + 1, out)
+            elif stmt_type == 'LOOP':
+                out.append(f"{pad}while {emit_expr(st['condition'])}:")
+                emit_block(st['body'], indent + 1, out)
+            elif stmt_type == 'PRINT':
+                expr = st['expression']
+                out.append(f"{pad}_ca_print({emit_expr(expr) if expr is not None else 'None'})")
             else:
-                raise CAInterpreterError(f"Runtime error: Unknown operator '{op}'")
-            i += 2
-        return result
+                raise _NotNumeric # CALL_STATEMENT keeps side effects interpreted
+
+        lines = ['def _f_{}({}):'.format(name, ', '.join('_v_' + p for p in params))]
+        emit_block(func_node['body'], 1, lines)
+        # Reads of outer-scope variables disqualify the function
+        if names_used - set(params) - assigned:
+            raise _NotNumeric
+        return lines, called
+
+    def _evaluate_expression(self, node, scope):
+        # One dict probe picks the handler for this node type; each tree
+        # node is visited exactly once
+        if node is None:
+            return None
+        try:
+            handler = self._expr_handlers[node.type]
+        except KeyError:
+            raise CAInterpreterError(f"Runtime error: Cannot evaluate expression part of type {node.type}")
+        return handler(node, scope)
+
+    def _eval_const(self, node, scope):
+        return node.value
+
+    def _eval_identifier(self, node, scope):
+        # The scope chain already bottoms out at the globals dict, so one
+        # chained lookup replaces the old pair of dict probes per read
+        val = scope.get(node.value)
+        if val is None:
+            raise CAInterpreterError(f"Runtime error: Undefined variable '{node.value}'")
+        return val
+
+    def _eval_local(self, node, scope):
+        val = scope.frame[node.slot]
+        if val is None:
+            raise CAInterpreterError(f"Runtime error: Undefined variable '{node.name}'")
+        return val
+
+    def _eval_call(self, node, scope):
+        return self._execute_call(node.name, node.args, scope)
+
+    def _eval_array_literal(self, node, scope):
+        eval_expr = self._evaluate_expression
+        return [eval_expr(elem, scope) for elem in node.elements]
+
+    def _eval_binop(self, node, scope):
+        eval_expr = self._evaluate_expression
+        left = eval_expr(node.left, scope)
+        right = eval_expr(node.right, scope)
+        fn = _OPS.get(node.op)
+        if fn is None:
+            raise CAInterpreterError(f"Runtime error: Unknown operator '{node.op}'")
+        try:
+            return fn(left, right)
+        except ZeroDivisionError:
+            raise CAInterpreterError("Runtime error: Division by zero.")
 
-    def _execute_call(self, call_node, scope):
-        func_name = call_node['name']
-        args_values = [self._evaluate_expression([arg], scope) for arg in call_node['args']]
+    def _execute_call(self, func_name, call_args, scope):
+        eval_expr = self._evaluate_expression
+        args_values = [eval_expr(arg, scope) for arg in call_args]
 
         # Built-in functions
-        if func_name == 'to_lower':
-            if len(args_values) != 1 or not isinstance(args_values[0], str):
-                raise CAInterpreterError("Runtime error: to_lower expects one string argument.")
-            return args_values[0].lower()
-        elif func_name == 'replace_char':
-            if len(args_values) != 3 or not all(isinstance(arg, str) for arg in args_values):
-                raise CAInterpreterError("Runtime error: replace_char expects three string arguments (text, old, new).")
-            return args_values[0].replace(args_values[1], args_values[2])
-        elif func_name == 'reverse':
-            if len(args_values) != 1 or not isinstance(args_values[0], str):
-                raise CAInterpreterError("Runtime error: reverse expects one string argument.")
-            return args_values[0][::-1]
-        elif func_name == 'len': # For arrays/strings
-            if len(args_values) != 1:
-                raise CAInterpreterError("Runtime error: len expects one argument.")
-            return len(args_values[0])
-        elif func_name == 'sum':
-            if len(args_values) != 1 or not isinstance(args_values[0], list):
-                raise CAInterpreterError("Runtime error: sum expects one array argument.")
-            return sum(args_values[0])
-        elif func_name == 'max':
-            if len(args_values) != 1 or not isinstance(args_values[0], list):
-                raise CAInterpreterError("Runtime error: max expects one array argument.")
-            if not args_values[0]: raise CAInterpreterError("Runtime error: max on empty array.")
-            return max(args_values[0])
-        elif func_name == 'min':
-            if len(args_values) != 1 or not isinstance(args_values[0], list):
-                raise CAInterpreterError("Runtime error: min expects one array argument.")
-            if not args_values[0]: raise CAInterpreterError("Runtime error: min on empty array.")
-            return min(args_values[0])
+        builtin = _BUILTINS.get(func_name)
+        if builtin is not None:
+            arity, arg_types, fn = builtin
+            if len(args_values) != arity or (
+                    arg_types is not None and
+                    any(not isinstance(arg, t) for arg, t in zip(args_values, arg_types))):
+                raise CAInterpreterError(f"Runtime error: {_BUILTIN_USAGE[func_name]}")
+            try:
+                return fn(args_values)
+            except ValueError:
+                raise CAInterpreterError(f"Runtime error: {func_name} on empty array.")
 
 
         # User-defined functions
@@ -353,52 +680,173 @@ class CAInterpreter:
             func_node = self.functions[func_name]
             if len(args_values) != len(func_node['params']):
                 raise CAInterpreterError(f"Runtime error: Function '{func_name}' expects {len(func_node['params'])} arguments, got {len(args_values)}.")
-            
-            # Create a new scope for the function call
-            func_scope = dict(scope) # Inherit outer scope, then override with params
-            for i, param_name in enumerate(func_node['params']):
-                func_scope[param_name] = args_values[i]
-            
+
+            jit_fn = self._jit_funcs.get(func_name)
+            if jit_fn is not None:
+                try:
+                    return jit_fn(*args_values)
+                except ZeroDivisionError:
+                    raise CAInterpreterError("Runtime error: Division by zero.")
+                except NameError:
+                    # Read-before-assign only the interpreter's scope
+                    # inheritance can satisfy; retire the compiled version
+                    del self._jit_funcs[func_name]
+
+            cache_key = None
+            if self.memoize_calls and func_node['memoizable']:
+                try:
+                    cache_key = (func_name, tuple(args_values))
+                    cached = self._call_cache.get(cache_key, _CACHE_MISS)
+                    if cached is not _CACHE_MISS:
+                        return cached
+                except TypeError:
+                    cache_key = None # Unhashable argument (array); run uncached
+
+            # Flat frame for locals; non-local names chain to the caller
+            frame = [None] * func_node['n_slots']
+            frame[:len(args_values)] = args_values
+            func_scope = _FuncScope(func_node['locals_map'], frame, scope)
+
             return_value = None
+            exec_stmt = self._execute_statement
             for statement in func_node['body']:
-                result = self._execute_statement(statement, func_scope)
-                if statement['type'] == 'RETURN':
-                    return result # Return value from the statement itself
+                result = exec_stmt(statement, func_scope)
+                # A bare RETURN ends the call; IF/LOOP handlers surface a
+                # non-None result only when a nested RETURN fired
+                if result is not None or statement['type'] == 'RETURN':
+                    return_value = result
+                    break
+            if cache_key is not None:
+                self._call_cache[cache_key] = return_value
             return return_value # If no explicit return, None
 
         raise CAInterpreterError(f"Runtime error: Undefined function '{func_name}'")
 
     def _execute_statement(self, statement, scope):
-        if statement['type'] == 'ASSIGN':
-            val = self._evaluate_expression(statement['value'], scope)
-            scope[statement['name']] = val # Assign to current scope
-        elif statement['type'] == 'PRINT':
-            val = self._evaluate_expression(statement['expression'], scope)
-            self.output_buffer.append(str(val))
-        elif statement['type'] == 'RETURN':
-            return self._evaluate_expression(statement['expression'], scope)
-        elif statement['type'] == 'CALL_STATEMENT':
-            self._execute_call(statement, scope) # Execute call, ignore return
-        elif statement['type'] == 'IF':
-            condition_result = self._evaluate_expression(statement['condition'], scope)
-            if condition_result:
-                for stmt in statement['body']:
-                    return_val = self._execute_statement(stmt, scope)
-                    if stmt['type'] == 'RETURN':
-                        return return_val
-            else:
-                for stmt in statement['else_body']:
-                    return_val = self._execute_statement(stmt, scope)
+        # Hashed dispatch: one dict probe instead of a string-compare ladder
+        # per statement per loop iteration
+        return self._stmt_handlers[statement['type']](statement, scope)
+
+    def _exec_assign(self, statement, scope):
+        scope[statement['name']] = self._evaluate_expression(statement['value'], scope)
+        return None
+
+    def _exec_assign_local(self, statement, scope):
+        scope.frame[statement['slot']] = self._evaluate_expression(statement['value'], scope)
+        return None
+
+    def _exec_print(self, statement, scope):
+        val = self._evaluate_expression(statement['expression'], scope)
+        # Strings skip the redundant str() round trip
+        self.output_buffer.append(val if type(val) is str else str(val))
+        return None
+
+    def _exec_return(self, statement, scope):
+        return self._evaluate_expression(statement['expression'], scope)
+
+    def _exec_call_stmt(self, statement, scope):
+        self._execute_call(statement['name'], statement['args'], scope) # Execute call, ignore return
+        return None
+
+    def _exec_if(self, statement, scope):
+        if self._evaluate_expression(statement['condition'], scope):
+            body = statement['body']
+        else:
+            body = statement['else_body']
+        exec_stmt = self._execute_statement
+        for stmt in body:
+            return_val = exec_stmt(stmt, scope)
+            if stmt['type'] == 'RETURN':
+                return return_val
+        return None
+
+    def _collect_assigned_names(self, statements, assigned):
+        for st in statements:
+            stmt_type = st['type']
+            if stmt_type in ('ASSIGN', 'ASSIGN_LOCAL'):
+                assigned.add(st['name'])
+            elif stmt_type == 'IF':
+                self._collect_assigned_names(st['body'], assigned)
+                self._collect_assigned_names(st['else_body'], assigned)
+            elif stmt_type == 'LOOP':
+                self._collect_assigned_names(st['body'], assigned)
+
+    def _fold_invariants(self, node, assigned, scope):
+        # Fold condition subtrees the loop body never writes to into CONST
+        # nodes, evaluated once at loop entry instead of every iteration.
+        # Calls stay un-folded since they may have side effects.
+        if node is None:
+            return None
+        node_type = node.type
+        if node_type is CONST:
+            return node
+        if node_type is IDENTIFIER or node_type is LOCAL:
+            name = node.value if node_type is IDENTIFIER else node.name
+            if name in assigned:
+                return node
+            return ConstNode(CONST, self._evaluate_expression(node, scope))
+        if node_type is BINOP:
+            left = self._fold_invariants(node.left, assigned, scope)
+            right = self._fold_invariants(node.right, assigned, scope)
+            if left.type is CONST and right.type is CONST:
+                return ConstNode(CONST, self._eval_binop(BinopNode(BINOP, node.op, left, right), scope))
+            return BinopNode(BINOP, node.op, left, right)
+        return node
+
+    @staticmethod
+    def _compile_cond(node):
+        # Close over simple var-vs-constant comparisons so each iteration
+        # costs one direct Python op instead of a trip through the generic
+        # dispatcher; anything more complex returns None and stays generic
+        if node is None or node.type is not BINOP:
+            return None
+        fn = _OPS.get(node.op)
+        if fn is None:
+            return None
+        left, right = node.left, node.right
+        if left.type is LOCAL and right.type is CONST:
+            slot, const = left.slot, right.value
+            return lambda scope: fn(scope.frame[slot], const)
+        if left.type is IDENTIFIER and right.type is CONST:
+            name, const = left.value, right.value
+            return lambda scope: fn(scope.get(name), const)
+        if left.type is CONST and right.type is LOCAL:
+            const, slot = left.value, right.slot
+            return lambda scope: fn(const, scope.frame[slot])
+        if left.type is CONST and right.type is IDENTIFIER:
+            const, name = left.value, right.value
+            return lambda scope: fn(const, scope.get(name))
+        return None
+
+    def _exec_loop(self, statement, scope):
+        body = statement['body']
+        assigned = statement.get('assigned_names')
+        if assigned is None:
+            assigned = set()
+            self._collect_assigned_names(body, assigned)
+            statement['assigned_names'] = assigned
+        condition = self._fold_invariants(statement['condition'], assigned, scope)
+        eval_expr = self._evaluate_expression
+        exec_stmt = self._execute_statement
+        cond_fn = self._compile_cond(condition)
+        if cond_fn is not None:
+            # First check stays generic so undefined variables raise the
+            # interpreter's own error before the fast loop takes over
+            if not eval_expr(condition, scope):
+                return None
+            while True:
+                for stmt in body:
+                    return_val = exec_stmt(stmt, scope)
                     if stmt['type'] == 'RETURN':
                         return return_val
-        elif statement['type'] == 'LOOP':
-            while self._evaluate_expression(statement['condition'], scope):
-                for stmt in statement['body']:
-                    return_val = self._execute_statement(stmt, scope)
-                    if stmt['type'] == 'RETURN': # Loop can't return from outer function directly, but if return is used, it breaks the loop
-                        return return_val
-        
-        return None # No specific return for most statements
+                if not cond_fn(scope):
+                    return None
+        while eval_expr(condition, scope):
+            for stmt in body:
+                return_val = exec_stmt(stmt, scope)
+                if stmt['type'] == 'RETURN': # Loop can't return from outer function directly, but if return is used, it breaks the loop
+                    return return_val
+        return None
 
     def execute(self, code):
         self._reset() # Clear state for a new execution
@@ -408,6 +856,26 @@ class CAInterpreter:
 
             # Populate top-level functions
             self.functions = ast['functions']
+            # Memoizability is transitive: a cache hit skips the whole
+            # body, so a function whose callees print or read the outer
+            # scope cannot be cached either. Fixpoint over the call
+            # graph, same shape as the numeric-lowering candidate prune.
+            if self.memoize_calls:
+                funcs = self.functions
+                changed = True
+                while changed:
+                    changed = False
+                    for fn in funcs.values():
+                        if fn['memoizable'] and any(
+                                not funcs[callee]['memoizable']
+                                for callee in fn['called_names']
+                                if callee in funcs):
+                            fn['memoizable'] = False
+                            changed = True
+            try:
+                self._jit_funcs = self._compile_numeric_funcs()
+            except Exception:
+                self._jit_funcs = {} # Lowering must never break execution
 
             # Execute main block
             global_scope = self.variables # Global variables
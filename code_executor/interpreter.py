@@ -1,6 +1,205 @@
+import operator
 from typing import Dict, List, Any, Optional
 from .lexical_analyzer import LexicalAnalyzer
-from .parser import Parser, ASTNode
+from .parser import Parser, ASTNode, NodeTypeId
+
+# Opcodes for the flat bytecode the compile pass emits. Instructions are
+# fixed-width (opcode, operand) pairs so jump targets are plain indices.
+OP_LOAD_CONST = 0
+OP_LOAD_NAME = 1
+OP_STORE_NAME = 2
+OP_ADD = 3
+OP_SUB = 4
+OP_MUL = 5
+OP_DIV = 6
+OP_MOD = 7
+OP_EQ = 8
+OP_NE = 9
+OP_LT = 10
+OP_LE = 11
+OP_GT = 12
+OP_GE = 13
+OP_AND = 14
+OP_OR = 15
+OP_JUMP = 16
+OP_JUMP_IF_FALSE = 17
+OP_CALL = 18
+OP_PRINT = 19
+OP_RETURN = 20
+OP_ARRAY_BUILD = 21
+OP_POP = 22
+OP_LOAD_LOCAL = 23
+OP_STORE_LOCAL = 24
+OP_BUILTIN = 25
+# Adaptive forms of the hottest binary ops: the generic opcode rewrites
+# itself to the _INT form once it sees int operands, and the _INT form
+# deoptimizes back if the guard ever fails (CPython-style specialization)
+OP_ADD_INT = 26
+OP_SUB_INT = 27
+OP_LT_INT = 28
+
+# Builtin name -> index into Interpreter._builtins, resolved at compile time
+_BUILTIN_IDS = {
+    'print': 0, 'len': 1, 'sum': 2, 'max': 3, 'min': 4,
+    'to_lower': 5, 'replace_char': 6, 'reverse': 7,
+}
+
+_BINOP_OPCODES = {
+    '+': OP_ADD, '-': OP_SUB, '*': OP_MUL, '/': OP_DIV, '%': OP_MOD,
+    '==': OP_EQ, '!=': OP_NE, '<': OP_LT, '<=': OP_LE, '>': OP_GT,
+    '>=': OP_GE, 'and': OP_AND, 'or': OP_OR,
+}
+
+class _ReturnSignal:
+    """Tree-walker return marker passed up through blocks instead of an
+    exception: no object unwinding on the common control-flow path"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+class CompiledFunction:
+    """A user function lowered to bytecode: parameter names plus code unit"""
+    __slots__ = ('name', 'params', 'code', 'consts', 'names', 'calls',
+                 'local_names', 'n_locals')
+
+    def __init__(self, name, params, code, consts, names, calls, local_names):
+        self.name = name
+        self.params = params
+        self.code = code
+        self.consts = consts
+        self.names = names
+        self.calls = calls
+        self.local_names = local_names
+        self.n_locals = len(local_names)
+
+class _CodeUnit:
+    """Accumulates one bytecode unit (main block or function body)"""
+
+    def __init__(self, interpreter, locals_map=None):
+        self.interpreter = interpreter
+        self.code = []
+        self.consts = []
+        self.const_ix = {}
+        self.names = []
+        self.name_ix = {}
+        # Per call site: (builtin id, argc) tuples for builtins, mutable
+        # [name, argc, version, func] inline caches for user calls
+        self.calls = []
+        # name -> frame slot for function bodies; None for the main unit,
+        # whose variables are the globals dict
+        self.locals_map = locals_map
+
+    def emit(self, op, arg=0):
+        self.code.append(op)
+        self.code.append(arg)
+        return len(self.code) - 1 # Index of the operand slot, for patching
+
+    def add_const(self, value):
+        # Deduped pool; keyed by type as well so 1, 1.0 and True keep
+        # distinct slots despite comparing equal
+        key = (value.__class__, value)
+        ix = self.const_ix.get(key)
+        if ix is None:
+            ix = self.const_ix[key] = len(self.consts)
+            self.consts.append(value)
+        return ix
+
+    def add_name(self, name):
+        ix = self.name_ix.get(name)
+        if ix is None:
+            ix = self.name_ix[name] = len(self.names)
+            self.names.append(name)
+        return ix
+
+    def compile_statement(self, node):
+        node_type = node.node_type
+        if node_type == "BLOCK":
+            for child in node.children:
+                self.compile_statement(child)
+        elif node_type == "MAIN":
+            self.compile_statement(node.children[0])
+        elif node_type == "FUNCTION":
+            self.interpreter.compile_function(node)
+        elif node_type == "IF":
+            self.compile_expression(node.children[0])
+            to_else = self.emit(OP_JUMP_IF_FALSE)
+            self.compile_statement(node.children[1])
+            if len(node.children) > 2:
+                to_end = self.emit(OP_JUMP)
+                self.code[to_else] = len(self.code)
+                self.compile_statement(node.children[2])
+                self.code[to_end] = len(self.code)
+            else:
+                self.code[to_else] = len(self.code)
+        elif node_type == "LOOP":
+            top = len(self.code)
+            self.compile_expression(node.children[0])
+            to_end = self.emit(OP_JUMP_IF_FALSE)
+            self.compile_statement(node.children[1])
+            self.emit(OP_JUMP, top)
+            self.code[to_end] = len(self.code)
+        elif node_type == "RETURN":
+            if node.children:
+                self.compile_expression(node.children[0])
+            else:
+                self.emit(OP_LOAD_CONST, self.add_const(None))
+            self.emit(OP_RETURN)
+        elif node_type == "PRINT":
+            self.compile_expression(node.children[0])
+            self.emit(OP_PRINT)
+        elif node_type == "ASSIGNMENT":
+            self.compile_expression(node.children[0])
+            if self.locals_map is not None:
+                self.emit(OP_STORE_LOCAL, self.locals_map[node.value])
+            else:
+                self.emit(OP_STORE_NAME, self.add_name(node.value))
+        elif node_type == "FUNCTION_CALL":
+            self.compile_expression(node)
+            self.emit(OP_POP)
+        else:
+            # Expression in statement position: evaluate and discard
+            self.compile_expression(node)
+            self.emit(OP_POP)
+
+    def compile_expression(self, node):
+        node_type = node.node_type
+        if node_type in ("NUMBER", "STRING", "BOOLEAN"):
+            value = node.value
+            if node_type == "NUMBER" and value.__class__ is str:
+                # The lexer hands numbers through as strings; parse once
+                # here so arithmetic adds instead of concatenating
+                value = float(value) if '.' in value else int(value)
+            self.emit(OP_LOAD_CONST, self.add_const(value))
+        elif node_type == "IDENTIFIER":
+            slot = self.locals_map.get(node.value) if self.locals_map is not None else None
+            if slot is not None:
+                self.emit(OP_LOAD_LOCAL, slot)
+            else:
+                self.emit(OP_LOAD_NAME, self.add_name(node.value))
+        elif node_type == "BINARY_OP":
+            op = _BINOP_OPCODES.get(node.value)
+            if op is None:
+                raise Exception(f"Unknown operator: {node.value}")
+            self.compile_expression(node.children[0])
+            self.compile_expression(node.children[1])
+            self.emit(op)
+        elif node_type == "FUNCTION_CALL":
+            for child in node.children:
+                self.compile_expression(child)
+            builtin_id = _BUILTIN_IDS.get(node.value)
+            if builtin_id is not None:
+                self.calls.append((builtin_id, len(node.children)))
+                self.emit(OP_BUILTIN, len(self.calls) - 1)
+            else:
+                self.calls.append([node.value, len(node.children), -1, None])
+                self.emit(OP_CALL, len(self.calls) - 1)
+        elif node_type == "ARRAY":
+            for child in node.children:
+                self.compile_expression(child)
+            self.emit(OP_ARRAY_BUILD, len(node.children))
+        else:
+            raise Exception(f"Unknown node type: {node_type}")
 
 class Environment:
     def __init__(self, parent=None):
@@ -37,30 +236,54 @@ class Interpreter:
     def __init__(self):
         self.global_env = Environment()
         self.output = []
-        self.setup_builtins()
-    
-    def setup_builtins(self):
-        """Setup built-in functions"""
-        # Built-in print function
-        self.global_env.define_function('print', ['value'], None)
-        
-        # Built-in len function
-        self.global_env.define_function('len', ['array'], None)
-        
-        # Built-in sum function
-        self.global_env.define_function('sum', ['array'], None)
-        
-        # Built-in max function
-        self.global_env.define_function('max', ['array'], None)
-        
-        # Built-in min function
-        self.global_env.define_function('min', ['array'], None)
-        
-        # String functions
-        self.global_env.define_function('to_lower', ['string'], None)
-        self.global_env.define_function('replace_char', ['string', 'old', 'new'], None)
-        self.global_env.define_function('reverse', ['string'], None)
+        self.compiled_functions = {}
+        # Bumped whenever the function table changes; call-site inline
+        # caches are valid only while their recorded version matches
+        self._functions_version = 0
+        # Indexed by _BUILTIN_IDS; OP_BUILTIN calls these directly with no
+        # name lookup or string compare
+        self._builtins = [
+            self._builtin_print,
+            len,
+            sum,
+            max,
+            min,
+            lambda value: str(value).lower(),
+            lambda text, old, new: str(text).replace(str(old), str(new)),
+            lambda value: str(value)[::-1],
+        ]
+        # Tree-walker dispatch: one indexed load on the node's integer id
+        # instead of up to fourteen string comparisons per node
+        dispatch = [None] * (max(NodeTypeId) + 1)
+        dispatch[NodeTypeId.FUNCTION] = self.execute_function_definition
+        dispatch[NodeTypeId.MAIN] = self.execute_main_block
+        dispatch[NodeTypeId.BLOCK] = self.execute_block
+        dispatch[NodeTypeId.IF] = self.execute_if_statement
+        dispatch[NodeTypeId.LOOP] = self.execute_loop_statement
+        dispatch[NodeTypeId.RETURN] = self.execute_return_statement
+        dispatch[NodeTypeId.PRINT] = self.execute_print_statement
+        dispatch[NodeTypeId.ASSIGNMENT] = self.execute_assignment
+        dispatch[NodeTypeId.FUNCTION_CALL] = self.execute_function_call
+        dispatch[NodeTypeId.BINARY_OP] = self.execute_binary_operation
+        dispatch[NodeTypeId.NUMBER] = self.execute_literal
+        dispatch[NodeTypeId.STRING] = self.execute_literal
+        dispatch[NodeTypeId.BOOLEAN] = self.execute_literal
+        dispatch[NodeTypeId.IDENTIFIER] = self.execute_identifier
+        dispatch[NodeTypeId.ARRAY] = self.execute_array
+        self._dispatch = dispatch
+        self._binops = {
+            '+': operator.add, '-': operator.sub, '*': operator.mul,
+            '/': operator.truediv, '%': operator.mod,
+            '==': operator.eq, '!=': operator.ne,
+            '<': operator.lt, '<=': operator.le,
+            '>': operator.gt, '>=': operator.ge,
+        }
     
+    def _builtin_print(self, value):
+        """print builtin: accumulate into the output buffer"""
+        self.output.append(value if type(value) is str else str(value))
+        return None
+
     def interpret(self, source: str) -> str:
         """Interpret CA language source code"""
         try:
@@ -75,15 +298,196 @@ class Interpreter:
             if ast.node_type == "ERROR":
                 return f"Parser Error: {ast.value}"
             
-            # Execution
+            # Execution: lower to bytecode once, then run the flat code
             self.output = []
-            self.execute_program(ast)
+            self.compiled_functions = {}
+            self._functions_version += 1
+            unit = _CodeUnit(self)
+            for child in ast.children:
+                unit.compile_statement(child)
+            self.run(unit.code, unit.consts, unit.names, unit.calls, self.global_env)
             
             return '\n'.join(self.output)
             
         except Exception as e:
             return f"Runtime Error: {str(e)}"
     
+    def compile_function(self, node: ASTNode):
+        """Lower a FUNCTION definition node to a CompiledFunction"""
+        params = node.children[0].value
+        # Params and every assigned name get frame slots before the body
+        # compiles, so reads of locals assigned later still resolve to slots
+        locals_map = {param: i for i, param in enumerate(params)}
+        self._collect_assignments(node.children[1], locals_map)
+        unit = _CodeUnit(self, locals_map)
+        unit.compile_statement(node.children[1])
+        local_names = [None] * len(locals_map)
+        for name, slot in locals_map.items():
+            local_names[slot] = name
+        self.compiled_functions[node.value] = CompiledFunction(
+            node.value, params, unit.code, unit.consts, unit.names, unit.calls,
+            local_names)
+        self._functions_version += 1
+
+    def _collect_assignments(self, node: ASTNode, locals_map: Dict[str, int]):
+        """Record a slot for every name assigned anywhere under node"""
+        if node.node_type == "ASSIGNMENT" and node.value not in locals_map:
+            locals_map[node.value] = len(locals_map)
+        for child in node.children:
+            self._collect_assignments(child, locals_map)
+
+    def run(self, code, consts, names, calls, env, frame=None, local_names=None):
+        """Execute one bytecode unit with a simple dispatch loop.
+
+        The while/elif chain is ordered roughly by opcode frequency; each
+        instruction costs one integer compare per rung instead of the
+        string comparisons and recursive execute_node calls of the tree
+        walker.
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        n = len(code)
+        while pc < n:
+            op = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+            if op == OP_LOAD_CONST:
+                push(consts[arg])
+            elif op == OP_LOAD_LOCAL:
+                value = frame[arg]
+                if value is None:
+                    raise Exception(f"Undefined variable: {local_names[arg]}")
+                push(value)
+            elif op == OP_STORE_LOCAL:
+                frame[arg] = pop()
+            elif op == OP_ADD_INT:
+                right = pop()
+                left = pop()
+                if type(left) is int and type(right) is int:
+                    push(left + right)
+                else:
+                    code[pc - 2] = OP_ADD
+                    push(left + right)
+            elif op == OP_LT_INT:
+                right = pop()
+                left = pop()
+                if type(left) is int and type(right) is int:
+                    push(left < right)
+                else:
+                    code[pc - 2] = OP_LT
+                    push(left < right)
+            elif op == OP_SUB_INT:
+                right = pop()
+                left = pop()
+                if type(left) is int and type(right) is int:
+                    push(left - right)
+                else:
+                    code[pc - 2] = OP_SUB
+                    push(left - right)
+            elif op == OP_LOAD_NAME:
+                push(env.get_variable(names[arg]))
+            elif op == OP_STORE_NAME:
+                env.define_variable(names[arg], pop())
+            elif op == OP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == OP_JUMP:
+                pc = arg
+            elif op == OP_BUILTIN:
+                builtin_id, argc = calls[arg]
+                args = stack[len(stack) - argc:] if argc else []
+                del stack[len(stack) - argc:]
+                push(self._builtins[builtin_id](*args))
+            elif op == OP_CALL:
+                entry = calls[arg]
+                argc = entry[1]
+                args = stack[len(stack) - argc:] if argc else []
+                del stack[len(stack) - argc:]
+                # Inline cache: one int compare replaces the dict lookup
+                # while no function has been (re)defined since the miss
+                if entry[2] == self._functions_version:
+                    func = entry[3]
+                else:
+                    func = self.compiled_functions.get(entry[0])
+                    if func is None:
+                        raise Exception(f"Undefined function: {entry[0]}")
+                    entry[2] = self._functions_version
+                    entry[3] = func
+                if argc != len(func.params):
+                    raise Exception(f"Function {entry[0]} expects {len(func.params)} arguments, got {argc}")
+                # Fresh name: rebinding `frame` would clobber this
+                # invocation's own locals
+                callee_frame = [None] * func.n_locals
+                callee_frame[:argc] = args
+                push(self.run(func.code, func.consts, func.names, func.calls,
+                              env, callee_frame, func.local_names))
+            elif op == OP_ADD:
+                right = pop()
+                left = pop()
+                push(left + right)
+                if type(left) is int and type(right) is int:
+                    code[pc - 2] = OP_ADD_INT
+            elif op == OP_LT:
+                right = pop()
+                left = pop()
+                push(left < right)
+                if type(left) is int and type(right) is int:
+                    code[pc - 2] = OP_LT_INT
+            elif op == OP_SUB:
+                right = pop()
+                left = pop()
+                push(left - right)
+                if type(left) is int and type(right) is int:
+                    code[pc - 2] = OP_SUB_INT
+            elif op == OP_MUL:
+                right = pop()
+                push(pop() * right)
+            elif op == OP_DIV:
+                right = pop()
+                if right == 0:
+                    raise Exception("Division by zero")
+                push(pop() / right)
+            elif op == OP_MOD:
+                right = pop()
+                push(pop() % right)
+            elif op == OP_EQ:
+                right = pop()
+                push(pop() == right)
+            elif op == OP_NE:
+                right = pop()
+                push(pop() != right)
+            elif op == OP_LE:
+                right = pop()
+                push(pop() <= right)
+            elif op == OP_GT:
+                right = pop()
+                push(pop() > right)
+            elif op == OP_GE:
+                right = pop()
+                push(pop() >= right)
+            elif op == OP_AND:
+                right = pop()
+                push(bool(pop()) and bool(right))
+            elif op == OP_OR:
+                right = pop()
+                push(bool(pop()) or bool(right))
+            elif op == OP_PRINT:
+                value = pop()
+                self.output.append(value if type(value) is str else str(value))
+            elif op == OP_RETURN:
+                return pop()
+            elif op == OP_ARRAY_BUILD:
+                args = stack[len(stack) - arg:] if arg else []
+                del stack[len(stack) - arg:]
+                push(args)
+            elif op == OP_POP:
+                pop()
+            else:
+                raise Exception(f"Unknown opcode: {op}")
+        return None
+
     def execute_program(self, node: ASTNode):
         """Execute a program node"""
         for child in node.children:
@@ -91,38 +495,22 @@ class Interpreter:
     
     def execute_node(self, node: ASTNode) -> Any:
         """Execute a single AST node"""
-        if node.node_type == "FUNCTION":
-            return self.execute_function_definition(node)
-        elif node.node_type == "MAIN":
-            return self.execute_main_block(node)
-        elif node.node_type == "BLOCK":
-            return self.execute_block(node)
-        elif node.node_type == "IF":
-            return self.execute_if_statement(node)
-        elif node.node_type == "LOOP":
-            return self.execute_loop_statement(node)
-        elif node.node_type == "RETURN":
-            return self.execute_return_statement(node)
-        elif node.node_type == "PRINT":
-            return self.execute_print_statement(node)
-        elif node.node_type == "ASSIGNMENT":
-            return self.execute_assignment(node)
-        elif node.node_type == "FUNCTION_CALL":
-            return self.execute_function_call(node)
-        elif node.node_type == "BINARY_OP":
-            return self.execute_binary_operation(node)
-        elif node.node_type == "NUMBER":
-            return node.value
-        elif node.node_type == "STRING":
-            return node.value
-        elif node.node_type == "BOOLEAN":
-            return node.value
-        elif node.node_type == "IDENTIFIER":
-            return self.global_env.get_variable(node.value)
-        elif node.node_type == "ARRAY":
-            return [self.execute_node(child) for child in node.children]
-        else:
+        handler = self._dispatch[node.node_type_id]
+        if handler is None:
             raise Exception(f"Unknown node type: {node.node_type}")
+        return handler(node)
+
+    def execute_literal(self, node: ASTNode) -> Any:
+        """Execute a NUMBER/STRING/BOOLEAN literal node"""
+        return node.value
+
+    def execute_identifier(self, node: ASTNode) -> Any:
+        """Execute an identifier read"""
+        return self.global_env.get_variable(node.value)
+
+    def execute_array(self, node: ASTNode) -> List[Any]:
+        """Execute an array literal node"""
+        return [self.execute_node(child) for child in node.children]
     
     def execute_function_definition(self, node: ASTNode):
         """Execute a function definition"""
@@ -132,6 +520,8 @@ class Interpreter:
         
         params = params_node.value
         self.global_env.define_function(name, params, body)
+        # Lower the body now so tree-walked calls run on flat frames too
+        self.compile_function(node)
     
     def execute_main_block(self, node: ASTNode):
         """Execute the main block"""
@@ -143,6 +533,8 @@ class Interpreter:
         result = None
         for child in node.children:
             result = self.execute_node(child)
+            if type(result) is _ReturnSignal:
+                return result
         return result
     
     def execute_if_statement(self, node: ASTNode):
@@ -151,7 +543,7 @@ class Interpreter:
         then_block = node.children[1]
         else_block = node.children[2] if len(node.children) > 2 else None
         
-        if self.is_truthy(condition):
+        if condition:
             return self.execute_node(then_block)
         elif else_block:
             return self.execute_node(else_block)
@@ -162,26 +554,22 @@ class Interpreter:
         condition = node.children[0]
         body = node.children[1]
         
-        while self.is_truthy(self.execute_node(condition)):
-            try:
-                self.execute_node(body)
-            except Exception as e:
-                if "break" in str(e):
-                    break
-                raise e
+        while self.execute_node(condition):
+            result = self.execute_node(body)
+            if type(result) is _ReturnSignal:
+                return result
         return None
     
     def execute_return_statement(self, node: ASTNode):
         """Execute a return statement"""
         if node.children:
-            value = self.execute_node(node.children[0])
-            raise ReturnException(value)
-        raise ReturnException(None)
+            return _ReturnSignal(self.execute_node(node.children[0]))
+        return _ReturnSignal(None)
     
     def execute_print_statement(self, node: ASTNode):
         """Execute a print statement"""
         value = self.execute_node(node.children[0])
-        self.output.append(str(value))
+        self.output.append(value if type(value) is str else str(value))
         return None
     
     def execute_assignment(self, node: ASTNode):
@@ -198,7 +586,8 @@ class Interpreter:
         
         # Handle built-in functions
         if name == 'print':
-            self.output.append(str(args[0]))
+            value = args[0]
+            self.output.append(value if type(value) is str else str(value))
             return None
         elif name == 'len':
             return len(args[0])
@@ -215,86 +604,38 @@ class Interpreter:
         elif name == 'reverse':
             return str(args[0])[::-1]
         
-        # Handle user-defined functions
-        try:
-            func_info = self.global_env.get_function(name)
-            params = func_info['params']
-            body = func_info['body']
-            
-            if len(args) != len(params):
-                raise Exception(f"Function {name} expects {len(params)} arguments, got {len(args)}")
-            
-            # Create new environment for function execution
-            func_env = Environment(self.global_env)
-            for param_name, arg_value in zip(params, args):
-                func_env.define_variable(param_name, arg_value)
-            
-            # Execute function body
-            old_env = self.global_env
-            self.global_env = func_env
-            
-            try:
-                result = self.execute_node(body)
-                return result
-            finally:
-                self.global_env = old_env
-                
-        except Exception as e:
-            if "Undefined function" in str(e):
-                raise Exception(f"Undefined function: {name}")
-            raise e
+        # User-defined functions run their compiled body on a flat frame:
+        # no per-call Environment, no swapping self.global_env in and out
+        func = self.compiled_functions.get(name)
+        if func is None:
+            raise Exception(f"Undefined function: {name}")
+        if len(args) != len(func.params):
+            raise Exception(f"Function {name} expects {len(func.params)} arguments, got {len(args)}")
+        frame = [None] * func.n_locals
+        frame[:len(args)] = args
+        return self.run(func.code, func.consts, func.names, func.calls,
+                        self.global_env, frame, func.local_names)
     
     def execute_binary_operation(self, node: ASTNode):
         """Execute a binary operation"""
         left = self.execute_node(node.children[0])
         right = self.execute_node(node.children[1])
-        operator = node.value
-        
-        if operator == '+':
-            return left + right
-        elif operator == '-':
-            return left - right
-        elif operator == '*':
-            return left * right
-        elif operator == '/':
-            if right == 0:
+        op = node.value
+
+        fn = self._binops.get(op)
+        if fn is not None:
+            if op == '/' and right == 0:
                 raise Exception("Division by zero")
-            return left / right
-        elif operator == '%':
-            return left % right
-        elif operator == '==':
-            return left == right
-        elif operator == '!=':
-            return left != right
-        elif operator == '<':
-            return left < right
-        elif operator == '<=':
-            return left <= right
-        elif operator == '>':
-            return left > right
-        elif operator == '>=':
-            return left >= right
-        elif operator == 'and':
-            return self.is_truthy(left) and self.is_truthy(right)
-        elif operator == 'or':
-            return self.is_truthy(left) or self.is_truthy(right)
+            return fn(left, right)
+        if op == 'and':
+            return bool(left) and bool(right)
+        elif op == 'or':
+            return bool(left) or bool(right)
         else:
-            raise Exception(f"Unknown operator: {operator}")
+            raise Exception(f"Unknown operator: {op}")
     
     def is_truthy(self, value: Any) -> bool:
         """Check if a value is truthy"""
-        if isinstance(value, bool):
-            return value
-        elif isinstance(value, (int, float)):
-            return value != 0
-        elif isinstance(value, str):
-            return len(value) > 0
-        elif isinstance(value, list):
-            return len(value) > 0
-        else:
-            return value is not None
-
-class ReturnException(Exception):
-    def __init__(self, value):
-        self.value = value
-        super().__init__("return") 
\ No newline at end of file
+        # bool() hits the type's C truth slot and matches the old
+        # isinstance chain for every value the language produces
+        return value is not None and bool(value)
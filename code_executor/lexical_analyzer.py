@@ -1,5 +1,6 @@
+import re
 from enum import Enum, auto
-from typing import List, Tuple, Optional
+from typing import List
 
 class TokenType(Enum):
     # Keywords
@@ -107,6 +108,8 @@ class TokenType(Enum):
     EOF = auto()
 
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, type: TokenType, value: str, line: int, column: int):
         self.type = type
         self.value = value
@@ -116,284 +119,206 @@ class Token:
     def __repr__(self):
         return f"Token({self.type}, '{self.value}', line={self.line}, col={self.column})"
 
+# One compiled alternation tokenizes the whole source in C-level regex
+# passes; m.lastgroup names the token class. Alternatives that can match
+# at the same position stay in precedence order (comments before
+# operators, multi-char operators before their prefixes); among
+# non-overlapping groups the common ones come first so each position
+# fails out of fewer branches. A catch-all BAD group surfaces lexer
+# errors with position info.
+_TOKEN_RE = re.compile(
+    r'(?P<WS>[^\S\n]+)'
+    r'|(?P<ID>[A-Za-z_][A-Za-z0-9_]*)'
+    r'|(?P<NUM>\d[0-9a-fA-F.]*)'
+    r'|(?P<NL>\n)'
+    r'|(?P<LCOM>//[^\n]*)'
+    r'|(?P<BCOM>/\*.*?\*/|/\*.*)'
+    r'|(?P<STR>"[^"\n]*")'
+    r'|(?P<CHR>\'[^\'\n]*\')'
+    r'|(?P<PP>#\s*[A-Za-z_][A-Za-z0-9_]*)'
+    r'|(?P<OP><<=|>>=|\+\+|--|->|<<|>>|==|!=|<=|>=|\+=|-=|\*=|/=|%=|&=|\|=|\^=|&&|\|\||[+\-*/%=<>!&|^~])'
+    r'|(?P<DEL>[()\[\]{},;:.#])'
+    r'|(?P<BAD>.)',
+    re.DOTALL)
+
+# The lexer is stateless apart from these tables, so they are built once
+# at import time instead of per instance.
+_KEYWORDS = {
+    'auto': TokenType.AUTO,
+    'break': TokenType.BREAK,
+    'case': TokenType.CASE,
+    'char': TokenType.CHAR,
+    'const': TokenType.CONST,
+    'continue': TokenType.CONTINUE,
+    'default': TokenType.DEFAULT,
+    'do': TokenType.DO,
+    'double': TokenType.DOUBLE,
+    'else': TokenType.ELSE,
+    'enum': TokenType.ENUM,
+    'extern': TokenType.EXTERN,
+    'float': TokenType.FLOAT,
+    'for': TokenType.FOR,
+    'goto': TokenType.GOTO,
+    'if': TokenType.IF,
+    'int': TokenType.INT,
+    'long': TokenType.LONG,
+    'register': TokenType.REGISTER,
+    'return': TokenType.RETURN,
+    'short': TokenType.SHORT,
+    'signed': TokenType.SIGNED,
+    'sizeof': TokenType.SIZEOF,
+    'static': TokenType.STATIC,
+    'struct': TokenType.STRUCT,
+    'switch': TokenType.SWITCH,
+    'typedef': TokenType.TYPEDEF,
+    'union': TokenType.UNION,
+    'unsigned': TokenType.UNSIGNED,
+    'void': TokenType.VOID,
+    'volatile': TokenType.VOLATILE,
+    'while': TokenType.WHILE,
+    }
+
+_OPERATORS = {
+    '++': TokenType.INCREMENT,
+    '--': TokenType.DECREMENT,
+    '->': TokenType.ARROW,
+    '<<=': TokenType.LEFT_SHIFT_ASSIGN,
+    '>>=': TokenType.RIGHT_SHIFT_ASSIGN,
+    '<<': TokenType.LEFT_SHIFT,
+    '>>': TokenType.RIGHT_SHIFT,
+    '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '+=': TokenType.PLUS_ASSIGN,
+    '-=': TokenType.MINUS_ASSIGN,
+    '*=': TokenType.MULTIPLY_ASSIGN,
+    '/=': TokenType.DIVIDE_ASSIGN,
+    '%=': TokenType.MODULO_ASSIGN,
+    '&=': TokenType.AND_ASSIGN,
+    '|=': TokenType.OR_ASSIGN,
+    '^=': TokenType.XOR_ASSIGN,
+    '&&': TokenType.AND,
+    '||': TokenType.OR,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '%': TokenType.MODULO,
+    '=': TokenType.ASSIGN,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    '!': TokenType.NOT,
+    '&': TokenType.BITWISE_AND,
+    '|': TokenType.BITWISE_OR,
+    '^': TokenType.BITWISE_XOR,
+    '~': TokenType.BITWISE_NOT,
+    }
+
+_DELIMITERS = {
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+    '.': TokenType.DOT,
+    '#': TokenType.HASH,
+    }
+
+_PREPROCESSOR = {
+    'include': TokenType.INCLUDE,
+    'define': TokenType.DEFINE,
+    'ifdef': TokenType.IFDEF,
+    'ifndef': TokenType.IFNDEF,
+    'endif': TokenType.ENDIF,
+    'elif': TokenType.ELIF,
+    'else': TokenType.ELSE_PP,
+    }
+
 class LexicalAnalyzer:
-    def __init__(self):
-        self.keywords = {
-            'auto': TokenType.AUTO,
-            'break': TokenType.BREAK,
-            'case': TokenType.CASE,
-            'char': TokenType.CHAR,
-            'const': TokenType.CONST,
-            'continue': TokenType.CONTINUE,
-            'default': TokenType.DEFAULT,
-            'do': TokenType.DO,
-            'double': TokenType.DOUBLE,
-            'else': TokenType.ELSE,
-            'enum': TokenType.ENUM,
-            'extern': TokenType.EXTERN,
-            'float': TokenType.FLOAT,
-            'for': TokenType.FOR,
-            'goto': TokenType.GOTO,
-            'if': TokenType.IF,
-            'int': TokenType.INT,
-            'long': TokenType.LONG,
-            'register': TokenType.REGISTER,
-            'return': TokenType.RETURN,
-            'short': TokenType.SHORT,
-            'signed': TokenType.SIGNED,
-            'sizeof': TokenType.SIZEOF,
-            'static': TokenType.STATIC,
-            'struct': TokenType.STRUCT,
-            'switch': TokenType.SWITCH,
-            'typedef': TokenType.TYPEDEF,
-            'union': TokenType.UNION,
-            'unsigned': TokenType.UNSIGNED,
-            'void': TokenType.VOID,
-            'volatile': TokenType.VOLATILE,
-            'while': TokenType.WHILE,
-        }
-        
-        self.operators = {
-            '++': TokenType.INCREMENT,
-            '--': TokenType.DECREMENT,
-            '->': TokenType.ARROW,
-            '<<=': TokenType.LEFT_SHIFT_ASSIGN,
-            '>>=': TokenType.RIGHT_SHIFT_ASSIGN,
-            '<<': TokenType.LEFT_SHIFT,
-            '>>': TokenType.RIGHT_SHIFT,
-            '==': TokenType.EQUAL,
-            '!=': TokenType.NOT_EQUAL,
-            '<=': TokenType.LESS_EQUAL,
-            '>=': TokenType.GREATER_EQUAL,
-            '+=': TokenType.PLUS_ASSIGN,
-            '-=': TokenType.MINUS_ASSIGN,
-            '*=': TokenType.MULTIPLY_ASSIGN,
-            '/=': TokenType.DIVIDE_ASSIGN,
-            '%=': TokenType.MODULO_ASSIGN,
-            '&=': TokenType.AND_ASSIGN,
-            '|=': TokenType.OR_ASSIGN,
-            '^=': TokenType.XOR_ASSIGN,
-            '&&': TokenType.AND,
-            '||': TokenType.OR,
-            '+': TokenType.PLUS,
-            '-': TokenType.MINUS,
-            '*': TokenType.MULTIPLY,
-            '/': TokenType.DIVIDE,
-            '%': TokenType.MODULO,
-            '=': TokenType.ASSIGN,
-            '<': TokenType.LESS_THAN,
-            '>': TokenType.GREATER_THAN,
-            '!': TokenType.NOT,
-            '&': TokenType.BITWISE_AND,
-            '|': TokenType.BITWISE_OR,
-            '^': TokenType.BITWISE_XOR,
-            '~': TokenType.BITWISE_NOT,
-        }
-        
-        self.delimiters = {
-            '(': TokenType.LPAREN,
-            ')': TokenType.RPAREN,
-            '[': TokenType.LBRACKET,
-            ']': TokenType.RBRACKET,
-            '{': TokenType.LBRACE,
-            '}': TokenType.RBRACE,
-            ',': TokenType.COMMA,
-            ';': TokenType.SEMICOLON,
-            ':': TokenType.COLON,
-            '.': TokenType.DOT,
-            '#': TokenType.HASH,
-        }
-        
-        self.preprocessor = {
-            'include': TokenType.INCLUDE,
-            'define': TokenType.DEFINE,
-            'ifdef': TokenType.IFDEF,
-            'ifndef': TokenType.IFNDEF,
-            'endif': TokenType.ENDIF,
-            'elif': TokenType.ELIF,
-            'else': TokenType.ELSE_PP,
-        }
+    # Class-level aliases keep the old instance attribute API working.
+    keywords = _KEYWORDS
+    operators = _OPERATORS
+    delimiters = _DELIMITERS
+    preprocessor = _PREPROCESSOR
     
-    def tokenize(self, source: str) -> List[Token]:
+    @staticmethod
+    def tokenize(source: str) -> List[Token]:
         tokens = []
-        current = 0
+        append = tokens.append
+        keywords = _KEYWORDS
+        operators = _OPERATORS
+        delimiters = _DELIMITERS
+        preprocessor = _PREPROCESSOR
+        make = Token
+        TT_NEWLINE = TokenType.NEWLINE
+        TT_IDENTIFIER = TokenType.IDENTIFIER
+        TT_NUMBER = TokenType.NUMBER
+        TT_STRING = TokenType.STRING
+        TT_CHARACTER = TokenType.CHARACTER
+        TT_COMMENT = TokenType.COMMENT
+        TT_COMMENT_BLOCK = TokenType.COMMENT_BLOCK
+        TT_HASH = TokenType.HASH
         line = 1
-        column = 1
+        line_start = 0
         
-        while current < len(source):
-            char = source[current]
-            
-            # Skip whitespace
-            if char.isspace():
-                if char == '\n':
-                    tokens.append(Token(TokenType.NEWLINE, '\n', line, column))
-                    line += 1
-                    column = 1
-                else:
-                    column += 1
-                current += 1
+        for m in _TOKEN_RE.finditer(source):
+            kind = m.lastgroup
+            if kind == 'WS':
                 continue
-            
-            # Handle comments
-            if char == '/' and current + 1 < len(source):
-                next_char = source[current + 1]
-                if next_char == '/':
-                    # Single line comment
-                    comment_start = current
-                    while current < len(source) and source[current] != '\n':
-                        current += 1
-                    comment = source[comment_start:current]
-                    tokens.append(Token(TokenType.COMMENT, comment, line, column))
-                    column += len(comment)
-                    continue
-                elif next_char == '*':
-                    # Multi-line comment
-                    comment_start = current
-                    current += 2  # Skip /*
-                    column += 2
-                    while current < len(source) - 1:
-                        if source[current] == '*' and source[current + 1] == '/':
-                            current += 2
-                            break
-                        if source[current] == '\n':
-                            line += 1
-                            column = 1
-                        else:
-                            column += 1
-                        current += 1
-                    comment = source[comment_start:current]
-                    tokens.append(Token(TokenType.COMMENT_BLOCK, comment, line, column))
-                    continue
-            
-            # Handle strings
-            if char == '"':
-                current += 1
-                column += 1
-                string_start = current
-                while current < len(source) and source[current] != '"':
-                    if source[current] == '\n':
-                        raise Exception(f"Unterminated string at line {line}, column {column}")
-                    current += 1
-                
-                if current >= len(source):
-                    raise Exception(f"Unterminated string at line {line}, column {column}")
-                
-                string_value = source[string_start:current]
-                tokens.append(Token(TokenType.STRING, string_value, line, column))
-                current += 1
-                column += len(string_value) + 2
+            text = m.group()
+            column = m.start() - line_start + 1
+            if kind == 'NL':
+                append(make(TT_NEWLINE, '\n', line, column))
+                line += 1
+                line_start = m.end()
                 continue
-            
-            # Handle character literals
-            if char == "'":
-                current += 1
-                column += 1
-                char_start = current
-                while current < len(source) and source[current] != "'":
-                    if source[current] == '\n':
-                        raise Exception(f"Unterminated character literal at line {line}, column {column}")
-                    current += 1
-                
-                if current >= len(source):
-                    raise Exception(f"Unterminated character literal at line {line}, column {column}")
-                
-                char_value = source[char_start:current]
-                tokens.append(Token(TokenType.CHARACTER, char_value, line, column))
-                current += 1
-                column += len(char_value) + 2
-                continue
-            
-            # Handle numbers
-            if char.isdigit():
-                number_start = current
-                while current < len(source) and (source[current].isdigit() or source[current] == '.' or 
-                                               source[current].lower() in 'abcdef'):
-                    current += 1
-                number = source[number_start:current]
-                tokens.append(Token(TokenType.NUMBER, number, line, column))
-                column += len(number)
-                continue
-            
-            # Handle identifiers and keywords
-            if char.isalpha() or char == '_':
-                identifier_start = current
-                while current < len(source) and (source[current].isalnum() or source[current] == '_'):
-                    current += 1
-                identifier = source[identifier_start:current]
-                
-                # Check if it's a keyword
-                if identifier.lower() in self.keywords:
-                    token_type = self.keywords[identifier.lower()]
-                    tokens.append(Token(token_type, identifier, line, column))
-                else:
-                    tokens.append(Token(TokenType.IDENTIFIER, identifier, line, column))
-                
-                column += len(identifier)
-                continue
-            
-            # Handle preprocessor directives
-            if char == '#':
-                current += 1
-                column += 1
-                # Skip whitespace after #
-                while current < len(source) and source[current].isspace():
-                    if source[current] == '\n':
-                        line += 1
-                        column = 1
-                    else:
-                        column += 1
-                    current += 1
-                
-                # Read preprocessor directive
-                directive_start = current
-                while current < len(source) and (source[current].isalnum() or source[current] == '_'):
-                    current += 1
-                directive = source[directive_start:current].lower()
-                
-                if directive in self.preprocessor:
-                    token_type = self.preprocessor[directive]
-                    tokens.append(Token(token_type, directive, line, column))
+            if kind == 'ID':
+                token_type = keywords.get(text)
+                append(make(token_type if token_type is not None else TT_IDENTIFIER,
+                             text, line, column))
+            elif kind == 'NUM':
+                append(make(TT_NUMBER, text, line, column))
+            elif kind == 'OP':
+                append(make(operators[text], text, line, column))
+            elif kind == 'DEL':
+                append(make(delimiters[text], text, line, column))
+            elif kind == 'STR':
+                append(make(TT_STRING, text[1:-1], line, column))
+            elif kind == 'CHR':
+                append(make(TT_CHARACTER, text[1:-1], line, column))
+            elif kind == 'LCOM':
+                append(make(TT_COMMENT, text, line, column))
+            elif kind == 'BCOM':
+                append(make(TT_COMMENT_BLOCK, text, line, column))
+                if '\n' in text:
+                    line += text.count('\n')
+                    line_start = m.start() + text.rfind('\n') + 1
+            elif kind == 'PP':
+                word = text[1:].lstrip()
+                directive = word.lower()
+                token_type = preprocessor.get(directive)
+                if '\n' in text:
+                    line += text.count('\n')
+                    line_start = m.start() + text.rfind('\n') + 1
+                if token_type is not None:
+                    append(make(token_type, directive, line, column))
                 else:
-                    tokens.append(Token(TokenType.HASH, '#', line, column))
-                    current = directive_start  # Reset to read as identifier
-                
-                column += len(directive)
-                continue
-            
-            # Handle operators and delimiters
-            # Try three-character operators first
-            if current + 2 < len(source):
-                three_char = source[current:current + 3]
-                if three_char in self.operators:
-                    tokens.append(Token(self.operators[three_char], three_char, line, column))
-                    current += 3
-                    column += 3
-                    continue
-            
-            # Try two-character operators
-            if current + 1 < len(source):
-                two_char = source[current:current + 2]
-                if two_char in self.operators:
-                    tokens.append(Token(self.operators[two_char], two_char, line, column))
-                    current += 2
-                    column += 2
-                    continue
-            
-            # Try single-character operators and delimiters
-            if char in self.operators:
-                tokens.append(Token(self.operators[char], char, line, column))
-                current += 1
-                column += 1
-                continue
-            
-            if char in self.delimiters:
-                tokens.append(Token(self.delimiters[char], char, line, column))
-                current += 1
-                column += 1
-                continue
-            
-            # Unknown character
-            raise Exception(f"Unknown character '{char}' at line {line}, column {column}")
-        
-        tokens.append(Token(TokenType.EOF, '', line, column))
-        return tokens 
\ No newline at end of file
+                    # Unknown directive: '#' then the word as a plain token
+                    append(make(TT_HASH, '#', line, column))
+                    keyword_type = keywords.get(word)
+                    append(make(keyword_type if keyword_type is not None else TT_IDENTIFIER,
+                                 word, line, column))
+            else: # BAD
+                if text == '"':
+                    raise Exception(f"Unterminated string at line {line}, column {column}")
+                if text == "'":
+                    raise Exception(f"Unterminated character literal at line {line}, column {column}")
+                raise Exception(f"Unknown character '{text}' at line {line}, column {column}")
+
+        tokens.append(Token(TokenType.EOF, '', line, len(source) - line_start + 1))
+        return tokens
@@ -1,20 +1,212 @@
+from collections import deque
+from enum import IntEnum
+from sys import intern as _intern
 from typing import List, Optional, Any
 from .lexical_analyzer import Token, TokenType
 
+class ParseError(Exception):
+    """Syntax error with deferred message formatting.
+
+    Raise sites pass a %-style format and its arguments; the message is
+    only rendered if something actually reads it. parse() catches the
+    error either way, so the common recovery path never pays for string
+    construction.
+    """
+    def __init__(self, fmt, *args):
+        super().__init__(fmt, *args)
+        self.fmt = fmt
+        self.args_ = args
+
+    def __str__(self):
+        return self.fmt % self.args_ if self.args_ else self.fmt
+
+class NodeTypeId(IntEnum):
+    """Integer ids for ASTNode.node_type
+
+    Hot consumers (the AST analysis walk) dispatch on these instead of
+    comparing node-type strings; UNKNOWN covers node types produced
+    outside this parser.
+    """
+    UNKNOWN = 0
+    PROGRAM = 1
+    ERROR = 2
+    INCLUDE = 3
+    DEFINE = 4
+    TYPE_SPECIFIER = 5
+    STRUCT_DEFINITION = 6
+    STRUCT_DECLARATION = 7
+    STRUCT_MEMBER = 8
+    FUNCTION_DEFINITION = 9
+    FUNCTION_DECLARATION = 10
+    FUNCTION_DECLARATOR = 11
+    VARIABLE_DECLARATION = 12
+    VARIABLE_DECLARATOR = 13
+    PARAMETER = 14
+    COMPOUND_STATEMENT = 15
+    IF_STATEMENT = 16
+    FOR_STATEMENT = 17
+    WHILE_STATEMENT = 18
+    DO_WHILE_STATEMENT = 19
+    RETURN_STATEMENT = 20
+    BREAK_STATEMENT = 21
+    CONTINUE_STATEMENT = 22
+    EXPRESSION_STATEMENT = 23
+    ASSIGNMENT_EXPRESSION = 24
+    LOGICAL_OR_EXPRESSION = 25
+    LOGICAL_AND_EXPRESSION = 26
+    EQUALITY_EXPRESSION = 27
+    RELATIONAL_EXPRESSION = 28
+    SHIFT_EXPRESSION = 29
+    ADDITIVE_EXPRESSION = 30
+    MULTIPLICATIVE_EXPRESSION = 31
+    UNARY_EXPRESSION = 32
+    POSTFIX_EXPRESSION = 33
+    ARRAY_ACCESS = 34
+    FUNCTION_CALL = 35
+    MEMBER_ACCESS = 36
+    POINTER_MEMBER_ACCESS = 37
+    NUMBER = 38
+    STRING = 39
+    CHARACTER = 40
+    IDENTIFIER = 41
+    COMMENT = 42
+    # Node kinds executed by the tree-walking Interpreter rather than
+    # produced by this parser; registered here so they carry integer ids
+    FUNCTION = 43
+    MAIN = 44
+    BLOCK = 45
+    IF = 46
+    LOOP = 47
+    RETURN = 48
+    PRINT = 49
+    ASSIGNMENT = 50
+    BINARY_OP = 51
+    BOOLEAN = 52
+    ARRAY = 53
+
+# String -> id lookup used once per node at construction time
+NODE_TYPE_IDS = {member.name: member.value for member in NodeTypeId}
+
 class ASTNode:
+    __slots__ = ('node_type', 'node_type_id', 'value', 'children')
+
     def __init__(self, node_type: str, value: Any = None, children: List['ASTNode'] = None):
         self.node_type = node_type
+        self.node_type_id = NODE_TYPE_IDS.get(node_type, 0)
         self.value = value
         self.children = children or []
-    
+
     def __repr__(self):
         return f"ASTNode({self.node_type}, {self.value}, {len(self.children)} children)"
 
+# Bounded free list of recycled nodes. Construction goes through
+# _new_node; callers that are done with a tree can hand it back via
+# Parser.release() so the next parse reuses the objects instead of
+# allocating fresh ones.
+_NODE_POOL: List[ASTNode] = []
+_NODE_POOL_CAP = 4096
+
+def _new_node(node_type: str, value: Any = None, children: List[ASTNode] = None) -> ASTNode:
+    if _NODE_POOL:
+        node = _NODE_POOL.pop()
+        node.node_type = node_type
+        node.node_type_id = NODE_TYPE_IDS.get(node_type, 0)
+        node.value = value
+        node.children = children or []
+        return node
+    return ASTNode(node_type, value, children)
+
+# Operator set probed once per token in parse_assignment_expression; a
+# module frozenset gives O(1) membership with no per-call list construction
+_DECL_START = frozenset((TokenType.INT, TokenType.CHAR, TokenType.FLOAT,
+                         TokenType.DOUBLE, TokenType.VOID, TokenType.STRUCT))
+_TYPE_SPEC = frozenset((TokenType.INT, TokenType.CHAR, TokenType.FLOAT,
+                        TokenType.DOUBLE, TokenType.VOID))
+_STMT_DECL_TYPES = frozenset((TokenType.INT, TokenType.CHAR, TokenType.FLOAT,
+                              TokenType.DOUBLE))
+_UNARY_OPS = frozenset((TokenType.PLUS, TokenType.MINUS, TokenType.NOT,
+                        TokenType.BITWISE_NOT))
+_INCDEC_OPS = frozenset((TokenType.INCREMENT, TokenType.DECREMENT))
+_ASSIGN_OPS = frozenset((
+    TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN,
+    TokenType.MULTIPLY_ASSIGN, TokenType.DIVIDE_ASSIGN, TokenType.MODULO_ASSIGN,
+    TokenType.AND_ASSIGN, TokenType.OR_ASSIGN, TokenType.XOR_ASSIGN,
+    TokenType.LEFT_SHIFT_ASSIGN, TokenType.RIGHT_SHIFT_ASSIGN,
+))
+
+# TokenType -> (binding power, node type) for the table-driven binary
+# expression parser; higher binds tighter. Node types match what the
+# old per-tier methods produced, so consumers see identical trees.
+_BINOP_TABLE = {
+    TokenType.OR: (1, "LOGICAL_OR_EXPRESSION"),
+    TokenType.AND: (2, "LOGICAL_AND_EXPRESSION"),
+    TokenType.EQUAL: (3, "EQUALITY_EXPRESSION"),
+    TokenType.NOT_EQUAL: (3, "EQUALITY_EXPRESSION"),
+    TokenType.LESS_THAN: (4, "RELATIONAL_EXPRESSION"),
+    TokenType.LESS_EQUAL: (4, "RELATIONAL_EXPRESSION"),
+    TokenType.GREATER_THAN: (4, "RELATIONAL_EXPRESSION"),
+    TokenType.GREATER_EQUAL: (4, "RELATIONAL_EXPRESSION"),
+    TokenType.LEFT_SHIFT: (5, "SHIFT_EXPRESSION"),
+    TokenType.RIGHT_SHIFT: (5, "SHIFT_EXPRESSION"),
+    TokenType.PLUS: (6, "ADDITIVE_EXPRESSION"),
+    TokenType.MINUS: (6, "ADDITIVE_EXPRESSION"),
+    TokenType.MULTIPLY: (7, "MULTIPLICATIVE_EXPRESSION"),
+    TokenType.DIVIDE: (7, "MULTIPLICATIVE_EXPRESSION"),
+    TokenType.MODULO: (7, "MULTIPLICATIVE_EXPRESSION"),
+}
+# Intern the tier node-type strings so every node built from the table
+# shares one string object and downstream node_type comparisons can
+# short-circuit on identity.
+_BINOP_TABLE = {tt: (prec, _intern(nt)) for tt, (prec, nt) in _BINOP_TABLE.items()}
+
 class Parser:
     def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+        # Comment tokens are never consumed by any production; they used
+        # to trickle through the unknown-token skip paths one loop
+        # iteration at a time. One bulk comprehension over the stream
+        # drops them before parsing starts.
+        self.tokens = tokens = [
+            token for token in tokens
+            if token.type is not TokenType.COMMENT
+            and token.type is not TokenType.COMMENT_BLOCK
+        ]
+        # Parallel array of just the types: the parse loops probe the
+        # type ~10x per token, and indexing a flat list skips the
+        # Token attribute lookup each time. Values/positions are still
+        # read from self.tokens at the few sites that need them.
+        self.token_types = [token.type for token in tokens]
+        # The stream never changes after construction, so the length is
+        # computed once here instead of per bounds check.
+        self._n = len(tokens)
         self.current = 0
-        self.errors = []
+        # Bounded ring buffer: a pathological input can raise per
+        # statement, and an unbounded error list grows with the input.
+        # 64 entries is far more than anyone reads from the editor.
+        self.errors = deque(maxlen=64)
+        # Dispatch tables keyed on token type: one dict probe replaces
+        # the statement and primary-expression elif ladders
+        self._stmt_dispatch = {
+            TokenType.IF: self.parse_if_statement,
+            TokenType.FOR: self.parse_for_statement,
+            TokenType.WHILE: self.parse_while_statement,
+            TokenType.DO: self.parse_do_while_statement,
+            TokenType.RETURN: self.parse_return_statement,
+            TokenType.BREAK: self.parse_break_statement,
+            TokenType.CONTINUE: self.parse_continue_statement,
+            TokenType.LBRACE: self.parse_compound_statement,
+            TokenType.INT: self.parse_variable_declaration,
+            TokenType.CHAR: self.parse_variable_declaration,
+            TokenType.FLOAT: self.parse_variable_declaration,
+            TokenType.DOUBLE: self.parse_variable_declaration,
+            TokenType.IDENTIFIER: self.parse_expression_statement,
+        }
+        self._prim_dispatch = {
+            TokenType.NUMBER: self._prim_number,
+            TokenType.STRING: self._prim_string,
+            TokenType.CHARACTER: self._prim_character,
+            TokenType.IDENTIFIER: self._prim_identifier,
+            TokenType.LPAREN: self._prim_paren,
+        }
     
     def parse(self) -> ASTNode:
         """Parse the tokens into an AST"""
@@ -22,19 +214,21 @@ class Parser:
             return self.parse_program()
         except Exception as e:
             self.errors.append(f"Parser Error: {str(e)}")
-            return ASTNode("ERROR", str(e))
+            return _new_node("ERROR", str(e))
     
     def parse_program(self) -> ASTNode:
         """Parse the entire C program"""
-        program = ASTNode("PROGRAM")
+        program = _new_node("PROGRAM")
         
-        while self.current < len(self.tokens) and self.tokens[self.current].type != TokenType.EOF:
-            if self.tokens[self.current].type == TokenType.INCLUDE:
+        types = self.token_types
+        n = self._n
+        while self.current < n and types[self.current] != TokenType.EOF:
+            token_type = types[self.current]
+            if token_type == TokenType.INCLUDE:
                 program.children.append(self.parse_include())
-            elif self.tokens[self.current].type == TokenType.DEFINE:
+            elif token_type == TokenType.DEFINE:
                 program.children.append(self.parse_define())
-            elif self.tokens[self.current].type in [TokenType.INT, TokenType.CHAR, TokenType.FLOAT, 
-                                                   TokenType.DOUBLE, TokenType.VOID, TokenType.STRUCT]:
+            elif token_type in _DECL_START:
                 # Could be a function declaration/definition or variable declaration
                 program.children.append(self.parse_declaration())
             else:
@@ -50,14 +244,14 @@ class Parser:
         # Handle both <header.h> and "header.h" formats
         if self.tokens[self.current].type == TokenType.STRING:
             header = self.expect(TokenType.STRING)
-            return ASTNode("INCLUDE", header.value)
+            return _new_node("INCLUDE", header.value)
         elif self.tokens[self.current].type == TokenType.LESS_THAN:
             self.expect(TokenType.LESS_THAN)
             header = self.expect(TokenType.IDENTIFIER)
             self.expect(TokenType.GREATER_THAN)
-            return ASTNode("INCLUDE", f"<{header.value}>")
+            return _new_node("INCLUDE", f"<{header.value}>")
         else:
-            raise Exception(f"Expected string or <header> at line {self.tokens[self.current].line}")
+            raise ParseError("Expected string or <header> at line %s", self.tokens[self.current].line)
     
     def parse_define(self) -> ASTNode:
         """Parse #define directive"""
@@ -65,10 +259,10 @@ class Parser:
         macro = self.expect(TokenType.IDENTIFIER)
         
         value = None
-        if self.current < len(self.tokens) and self.tokens[self.current].type != TokenType.NEWLINE:
+        if self.current < self._n and self.tokens[self.current].type != TokenType.NEWLINE:
             value = self.parse_expression()
         
-        return ASTNode("DEFINE", macro.value, [value] if value else [])
+        return _new_node("DEFINE", macro.value, [value] if value else [])
     
     def parse_declaration(self) -> ASTNode:
         """Parse variable or function declaration"""
@@ -81,27 +275,27 @@ class Parser:
         if self.tokens[self.current].type == TokenType.SEMICOLON:
             # Variable declaration
             self.expect(TokenType.SEMICOLON)
-            return ASTNode("VARIABLE_DECLARATION", type_spec, [declarator])
+            return _new_node("VARIABLE_DECLARATION", type_spec, [declarator])
         elif self.tokens[self.current].type == TokenType.LBRACE:
             # Function definition
             body = self.parse_compound_statement()
-            return ASTNode("FUNCTION_DEFINITION", type_spec, [declarator, body])
+            return _new_node("FUNCTION_DEFINITION", type_spec, [declarator, body])
         else:
             # Function declaration
             self.expect(TokenType.SEMICOLON)
-            return ASTNode("FUNCTION_DECLARATION", type_spec, [declarator])
+            return _new_node("FUNCTION_DECLARATION", type_spec, [declarator])
     
     def parse_type_specifier(self) -> ASTNode:
         """Parse type specifier"""
         token = self.tokens[self.current]
         
-        if token.type in [TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.DOUBLE, TokenType.VOID]:
+        if token.type in _TYPE_SPEC:
             self.current += 1
-            return ASTNode("TYPE_SPECIFIER", token.value)
+            return _new_node("TYPE_SPECIFIER", token.value)
         elif token.type == TokenType.STRUCT:
             return self.parse_struct_declaration()
         else:
-            raise Exception(f"Expected type specifier at line {token.line}")
+            raise ParseError("Expected type specifier at line %s", token.line)
     
     def parse_struct_declaration(self) -> ASTNode:
         """Parse struct declaration"""
@@ -115,26 +309,26 @@ class Parser:
                 self.expect(TokenType.LBRACE)
                 members = []
                 
-                while self.current < len(self.tokens) and self.tokens[self.current].type != TokenType.RBRACE:
-                    if self.tokens[self.current].type in [TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.DOUBLE]:
+                while self.current < self._n and self.tokens[self.current].type != TokenType.RBRACE:
+                    if self.token_types[self.current] in _STMT_DECL_TYPES:
                         members.append(self.parse_struct_member())
                     else:
                         self.current += 1
                 
                 self.expect(TokenType.RBRACE)
-                return ASTNode("STRUCT_DEFINITION", tag.value, members)
+                return _new_node("STRUCT_DEFINITION", tag.value, members)
             else:
                 # Struct declaration
-                return ASTNode("STRUCT_DECLARATION", tag.value)
+                return _new_node("STRUCT_DECLARATION", tag.value)
         else:
-            raise Exception(f"Expected struct tag at line {self.tokens[self.current].line}")
+            raise ParseError("Expected struct tag at line %s", self.tokens[self.current].line)
     
     def parse_struct_member(self) -> ASTNode:
         """Parse struct member"""
         type_spec = self.parse_type_specifier()
         declarator = self.parse_declarator()
         self.expect(TokenType.SEMICOLON)
-        return ASTNode("STRUCT_MEMBER", type_spec, [declarator])
+        return _new_node("STRUCT_MEMBER", type_spec, [declarator])
     
     def parse_declarator(self) -> ASTNode:
         """Parse declarator (variable name, function name, etc.)"""
@@ -148,12 +342,12 @@ class Parser:
                 
                 if self.tokens[self.current].type != TokenType.RPAREN:
                     while True:
-                        if self.tokens[self.current].type in [TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.DOUBLE, TokenType.VOID]:
+                        if self.token_types[self.current] in _TYPE_SPEC:
                             param_type = self.parse_type_specifier()
                             param_name = None
                             if self.tokens[self.current].type == TokenType.IDENTIFIER:
                                 param_name = self.expect(TokenType.IDENTIFIER)
-                            params.append(ASTNode("PARAMETER", param_type, [param_name] if param_name else []))
+                            params.append(_new_node("PARAMETER", param_type, [param_name] if param_name else []))
                         else:
                             self.current += 1
                         
@@ -162,20 +356,22 @@ class Parser:
                         self.expect(TokenType.COMMA)
                 
                 self.expect(TokenType.RPAREN)
-                return ASTNode("FUNCTION_DECLARATOR", name.value, params)
+                return _new_node("FUNCTION_DECLARATOR", name.value, params)
             else:
                 # Variable declarator
-                return ASTNode("VARIABLE_DECLARATOR", name.value)
+                return _new_node("VARIABLE_DECLARATOR", name.value)
         else:
-            raise Exception(f"Expected identifier at line {self.tokens[self.current].line}")
+            raise ParseError("Expected identifier at line %s", self.tokens[self.current].line)
     
     def parse_compound_statement(self) -> ASTNode:
         """Parse compound statement (block)"""
         self.expect(TokenType.LBRACE)
         
         statements = []
-        while self.current < len(self.tokens) and self.tokens[self.current].type != TokenType.RBRACE:
-            if self.tokens[self.current].type == TokenType.NEWLINE:
+        types = self.token_types
+        n = self._n
+        while self.current < n and types[self.current] != TokenType.RBRACE:
+            if types[self.current] == TokenType.NEWLINE:
                 self.current += 1
                 continue
             
@@ -184,43 +380,24 @@ class Parser:
                 statements.append(statement)
         
         self.expect(TokenType.RBRACE)
-        return ASTNode("COMPOUND_STATEMENT", statements)
+        return _new_node("COMPOUND_STATEMENT", statements)
     
     def parse_statement(self) -> Optional[ASTNode]:
         """Parse a single statement"""
-        if self.current >= len(self.tokens):
+        if self.current >= self._n:
             return None
         
-        token = self.tokens[self.current]
-        
-        if token.type == TokenType.IF:
-            return self.parse_if_statement()
-        elif token.type == TokenType.FOR:
-            return self.parse_for_statement()
-        elif token.type == TokenType.WHILE:
-            return self.parse_while_statement()
-        elif token.type == TokenType.DO:
-            return self.parse_do_while_statement()
-        elif token.type == TokenType.RETURN:
-            return self.parse_return_statement()
-        elif token.type == TokenType.BREAK:
-            return self.parse_break_statement()
-        elif token.type == TokenType.CONTINUE:
-            return self.parse_continue_statement()
-        elif token.type == TokenType.LBRACE:
-            return self.parse_compound_statement()
-        elif token.type in [TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.DOUBLE]:
-            return self.parse_variable_declaration()
-        elif token.type == TokenType.IDENTIFIER:
-            return self.parse_expression_statement()
-        else:
+        handler = self._stmt_dispatch.get(self.token_types[self.current])
+        if handler is None:
             # Skip unknown tokens
             self.current += 1
             return None
+        return handler()
     
     def parse_if_statement(self) -> ASTNode:
         """Parse if statement"""
-        self.expect(TokenType.IF)
+        # Dispatch already proved the leading IF; skip the expect probe.
+        self.current += 1
         self.expect(TokenType.LPAREN)
         condition = self.parse_expression()
         self.expect(TokenType.RPAREN)
@@ -228,35 +405,34 @@ class Parser:
         then_statement = self.parse_statement()
         
         else_statement = None
-        if self.current < len(self.tokens) and self.tokens[self.current].type == TokenType.ELSE:
-            self.expect(TokenType.ELSE)
+        types = self.token_types
+        if self.current < self._n and types[self.current] is TokenType.ELSE:
+            self.current += 1
             else_statement = self.parse_statement()
         
-        return ASTNode("IF_STATEMENT", "if", [condition, then_statement, else_statement])
+        return _new_node("IF_STATEMENT", "if", [condition, then_statement, else_statement])
     
     def parse_for_statement(self) -> ASTNode:
         """Parse for statement"""
-        self.expect(TokenType.FOR)
+        # Dispatch already proved the leading FOR; skip the expect probe.
+        self.current += 1
         self.expect(TokenType.LPAREN)
         
-        init = None
-        if self.tokens[self.current].type != TokenType.SEMICOLON:
-            init = self.parse_expression()
-        self.expect(TokenType.SEMICOLON)
+        types = self.token_types
+        SEMI = TokenType.SEMICOLON
+        init = None if types[self.current] is SEMI else self.parse_expression()
+        self.expect(SEMI)
         
-        condition = None
-        if self.tokens[self.current].type != TokenType.SEMICOLON:
-            condition = self.parse_expression()
-        self.expect(TokenType.SEMICOLON)
+        condition = None if types[self.current] is SEMI else self.parse_expression()
+        self.expect(SEMI)
         
-        update = None
-        if self.tokens[self.current].type != TokenType.RPAREN:
-            update = self.parse_expression()
-        self.expect(TokenType.RPAREN)
+        RPAREN = TokenType.RPAREN
+        update = None if types[self.current] is RPAREN else self.parse_expression()
+        self.expect(RPAREN)
         
         body = self.parse_statement()
         
-        return ASTNode("FOR_STATEMENT", "for", [init, condition, update, body])
+        return _new_node("FOR_STATEMENT", "for", [init, condition, update, body])
     
     def parse_while_statement(self) -> ASTNode:
         """Parse while statement"""
@@ -266,7 +442,7 @@ class Parser:
         self.expect(TokenType.RPAREN)
         body = self.parse_statement()
         
-        return ASTNode("WHILE_STATEMENT", "while", [condition, body])
+        return _new_node("WHILE_STATEMENT", "while", [condition, body])
     
     def parse_do_while_statement(self) -> ASTNode:
         """Parse do-while statement"""
@@ -278,7 +454,7 @@ class Parser:
         self.expect(TokenType.RPAREN)
         self.expect(TokenType.SEMICOLON)
         
-        return ASTNode("DO_WHILE_STATEMENT", "do-while", [body, condition])
+        return _new_node("DO_WHILE_STATEMENT", "do-while", [body, condition])
     
     def parse_return_statement(self) -> ASTNode:
         """Parse return statement"""
@@ -288,32 +464,32 @@ class Parser:
             value = self.parse_expression()
         self.expect(TokenType.SEMICOLON)
         
-        return ASTNode("RETURN_STATEMENT", "return", [value] if value else [])
+        return _new_node("RETURN_STATEMENT", "return", [value] if value else [])
     
     def parse_break_statement(self) -> ASTNode:
         """Parse break statement"""
         self.expect(TokenType.BREAK)
         self.expect(TokenType.SEMICOLON)
-        return ASTNode("BREAK_STATEMENT", "break")
+        return _new_node("BREAK_STATEMENT", "break")
     
     def parse_continue_statement(self) -> ASTNode:
         """Parse continue statement"""
         self.expect(TokenType.CONTINUE)
         self.expect(TokenType.SEMICOLON)
-        return ASTNode("CONTINUE_STATEMENT", "continue")
+        return _new_node("CONTINUE_STATEMENT", "continue")
     
     def parse_variable_declaration(self) -> ASTNode:
         """Parse variable declaration"""
         type_spec = self.parse_type_specifier()
         declarator = self.parse_declarator()
         self.expect(TokenType.SEMICOLON)
-        return ASTNode("VARIABLE_DECLARATION", type_spec, [declarator])
+        return _new_node("VARIABLE_DECLARATION", type_spec, [declarator])
     
     def parse_expression_statement(self) -> ASTNode:
         """Parse expression statement"""
         expr = self.parse_expression()
         self.expect(TokenType.SEMICOLON)
-        return ASTNode("EXPRESSION_STATEMENT", expr)
+        return _new_node("EXPRESSION_STATEMENT", expr)
     
     def parse_expression(self) -> ASTNode:
         """Parse an expression"""
@@ -323,119 +499,67 @@ class Parser:
         """Parse assignment expression"""
         left = self.parse_logical_or_expression()
         
-        if self.current < len(self.tokens) and self.tokens[self.current].type in [
-            TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN,
-            TokenType.MULTIPLY_ASSIGN, TokenType.DIVIDE_ASSIGN, TokenType.MODULO_ASSIGN,
-            TokenType.AND_ASSIGN, TokenType.OR_ASSIGN, TokenType.XOR_ASSIGN,
-            TokenType.LEFT_SHIFT_ASSIGN, TokenType.RIGHT_SHIFT_ASSIGN
-        ]:
-            operator = self.tokens[self.current].value
+        tokens = self.tokens
+        if self.current < self._n and self.token_types[self.current] in _ASSIGN_OPS:
+            # Operator lexemes arrive as fresh regex slices; interning
+            # collapses the duplicates and makes later == checks on the
+            # node value an identity hit.
+            operator = _intern(tokens[self.current].value)
             self.current += 1
             right = self.parse_assignment_expression()
-            return ASTNode("ASSIGNMENT_EXPRESSION", operator, [left, right])
+            return _new_node("ASSIGNMENT_EXPRESSION", operator, [left, right])
         
         return left
     
     def parse_logical_or_expression(self) -> ASTNode:
-        """Parse logical OR expression"""
-        left = self.parse_logical_and_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type == TokenType.OR:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_logical_and_expression()
-            left = ASTNode("LOGICAL_OR_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_logical_and_expression(self) -> ASTNode:
-        """Parse logical AND expression"""
-        left = self.parse_equality_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type == TokenType.AND:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_equality_expression()
-            left = ASTNode("LOGICAL_AND_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_equality_expression(self) -> ASTNode:
-        """Parse equality expression"""
-        left = self.parse_relational_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type in [TokenType.EQUAL, TokenType.NOT_EQUAL]:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_relational_expression()
-            left = ASTNode("EQUALITY_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_relational_expression(self) -> ASTNode:
-        """Parse relational expression"""
-        left = self.parse_shift_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type in [
-            TokenType.LESS_THAN, TokenType.LESS_EQUAL, TokenType.GREATER_THAN, TokenType.GREATER_EQUAL
-        ]:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_shift_expression()
-            left = ASTNode("RELATIONAL_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_shift_expression(self) -> ASTNode:
-        """Parse shift expression"""
-        left = self.parse_additive_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type in [TokenType.LEFT_SHIFT, TokenType.RIGHT_SHIFT]:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_additive_expression()
-            left = ASTNode("SHIFT_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_additive_expression(self) -> ASTNode:
-        """Parse additive expression"""
-        left = self.parse_multiplicative_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type in [TokenType.PLUS, TokenType.MINUS]:
-            operator = self.tokens[self.current].value
-            self.current += 1
-            right = self.parse_multiplicative_expression()
-            left = ASTNode("ADDITIVE_EXPRESSION", operator, [left, right])
-        
-        return left
-    
-    def parse_multiplicative_expression(self) -> ASTNode:
-        """Parse multiplicative expression"""
-        left = self.parse_unary_expression()
-        
-        while self.current < len(self.tokens) and self.tokens[self.current].type in [TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO]:
-            operator = self.tokens[self.current].value
+        """Parse the binary-operator tiers (|| down through * / %).
+
+        Shunting-yard over the precedence table: explicit operand and
+        operator stacks in one Python frame instead of a recursive call
+        per operator, so nested expressions cost list pushes rather than
+        interpreter frames. Reductions pop while the stacked operator
+        binds at least as tightly, which keeps every tier
+        left-associative like the old per-tier loops.
+        """
+        out = [self.parse_unary_expression()]
+        ops = []
+        tokens = self.tokens
+        types = self.token_types
+        while True:
+            info = _BINOP_TABLE.get(types[self.current])
+            if info is None:
+                break
+            prec, node_type = info
+            operator = _intern(tokens[self.current].value)
             self.current += 1
-            right = self.parse_unary_expression()
-            left = ASTNode("MULTIPLICATIVE_EXPRESSION", operator, [left, right])
-        
-        return left
+            while ops and ops[-1][0] >= prec:
+                _, op_value, op_node_type = ops.pop()
+                right = out.pop()
+                left = out.pop()
+                out.append(_new_node(op_node_type, op_value, [left, right]))
+            ops.append((prec, operator, node_type))
+            out.append(self.parse_unary_expression())
+        while ops:
+            _, op_value, op_node_type = ops.pop()
+            right = out.pop()
+            left = out.pop()
+            out.append(_new_node(op_node_type, op_value, [left, right]))
+        return out[0]
     
     def parse_unary_expression(self) -> ASTNode:
         """Parse unary expression"""
         token = self.tokens[self.current]
         
-        if token.type in [TokenType.PLUS, TokenType.MINUS, TokenType.NOT, TokenType.BITWISE_NOT]:
-            operator = token.value
+        if token.type in _UNARY_OPS:
+            operator = _intern(token.value)
             self.current += 1
             operand = self.parse_unary_expression()
-            return ASTNode("UNARY_EXPRESSION", operator, [operand])
-        elif token.type in [TokenType.INCREMENT, TokenType.DECREMENT]:
-            operator = token.value
+            return _new_node("UNARY_EXPRESSION", operator, [operand])
+        elif token.type in _INCDEC_OPS:
+            operator = _intern(token.value)
             self.current += 1
             operand = self.parse_postfix_expression()
-            return ASTNode("UNARY_EXPRESSION", operator, [operand])
+            return _new_node("UNARY_EXPRESSION", operator, [operand])
         else:
             return self.parse_postfix_expression()
     
@@ -443,44 +567,47 @@ class Parser:
         """Parse postfix expression"""
         left = self.parse_primary_expression()
         
-        while self.current < len(self.tokens):
-            token = self.tokens[self.current]
+        tokens = self.tokens
+        types = self.token_types
+        n = self._n
+        while self.current < n:
+            token_type = types[self.current]
             
-            if token.type == TokenType.LBRACKET:
+            if token_type == TokenType.LBRACKET:
                 # Array access
                 self.expect(TokenType.LBRACKET)
                 index = self.parse_expression()
                 self.expect(TokenType.RBRACKET)
-                left = ASTNode("ARRAY_ACCESS", "[]", [left, index])
-            elif token.type == TokenType.LPAREN:
+                left = _new_node("ARRAY_ACCESS", "[]", [left, index])
+            elif token_type == TokenType.LPAREN:
                 # Function call
                 self.expect(TokenType.LPAREN)
                 args = []
                 
-                if self.tokens[self.current].type != TokenType.RPAREN:
+                if types[self.current] != TokenType.RPAREN:
                     while True:
                         args.append(self.parse_expression())
-                        if self.tokens[self.current].type == TokenType.RPAREN:
+                        if types[self.current] == TokenType.RPAREN:
                             break
                         self.expect(TokenType.COMMA)
                 
                 self.expect(TokenType.RPAREN)
-                left = ASTNode("FUNCTION_CALL", "()", [left] + args)
-            elif token.type in [TokenType.INCREMENT, TokenType.DECREMENT]:
+                left = _new_node("FUNCTION_CALL", "()", [left] + args)
+            elif token_type in _INCDEC_OPS:
                 # Postfix increment/decrement
-                operator = token.value
+                operator = _intern(tokens[self.current].value)
                 self.current += 1
-                left = ASTNode("POSTFIX_EXPRESSION", operator, [left])
-            elif token.type == TokenType.DOT:
+                left = _new_node("POSTFIX_EXPRESSION", operator, [left])
+            elif token_type == TokenType.DOT:
                 # Member access
                 self.expect(TokenType.DOT)
                 member = self.expect(TokenType.IDENTIFIER)
-                left = ASTNode("MEMBER_ACCESS", ".", [left, member])
-            elif token.type == TokenType.ARROW:
+                left = _new_node("MEMBER_ACCESS", ".", [left, member])
+            elif token_type == TokenType.ARROW:
                 # Pointer member access
                 self.expect(TokenType.ARROW)
                 member = self.expect(TokenType.IDENTIFIER)
-                left = ASTNode("POINTER_MEMBER_ACCESS", "->", [left, member])
+                left = _new_node("POINTER_MEMBER_ACCESS", "->", [left, member])
             else:
                 break
         
@@ -490,34 +617,75 @@ class Parser:
         """Parse primary expression"""
         token = self.tokens[self.current]
         
-        if token.type == TokenType.NUMBER:
-            self.current += 1
-            return ASTNode("NUMBER", float(token.value))
-        elif token.type == TokenType.STRING:
-            self.current += 1
-            return ASTNode("STRING", token.value)
-        elif token.type == TokenType.CHARACTER:
-            self.current += 1
-            return ASTNode("CHARACTER", token.value)
-        elif token.type == TokenType.IDENTIFIER:
-            self.current += 1
-            return ASTNode("IDENTIFIER", token.value)
-        elif token.type == TokenType.LPAREN:
-            self.expect(TokenType.LPAREN)
-            expr = self.parse_expression()
-            self.expect(TokenType.RPAREN)
-            return expr
-        else:
-            raise Exception(f"Unexpected token {token.type} at line {token.line}, column {token.column}")
+        handler = self._prim_dispatch.get(token.type)
+        if handler is None:
+            raise ParseError("Unexpected token %s at line %s, column %s", token.type, token.line, token.column)
+        return handler(token)
+    
+    def _prim_number(self, token: Token) -> ASTNode:
+        """NUMBER literal primary"""
+        self.current += 1
+        return _new_node("NUMBER", float(token.value))
+    
+    def _prim_string(self, token: Token) -> ASTNode:
+        """STRING literal primary"""
+        self.current += 1
+        return _new_node("STRING", token.value)
+    
+    def _prim_character(self, token: Token) -> ASTNode:
+        """CHARACTER literal primary"""
+        self.current += 1
+        return _new_node("CHARACTER", token.value)
+    
+    def _prim_identifier(self, token: Token) -> ASTNode:
+        """Identifier primary"""
+        self.current += 1
+        return _new_node("IDENTIFIER", token.value)
+    
+    def _prim_paren(self, token: Token) -> ASTNode:
+        """Parenthesized primary"""
+        self.expect(TokenType.LPAREN)
+        expr = self.parse_expression()
+        self.expect(TokenType.RPAREN)
+        return expr
     
     def expect(self, expected_type: TokenType) -> Token:
         """Expect a specific token type and advance"""
-        if self.current >= len(self.tokens):
-            raise Exception(f"Expected {expected_type}, but reached end of input")
-        
-        token = self.tokens[self.current]
-        if token.type != expected_type:
-            raise Exception(f"Expected {expected_type}, but got {token.type} at line {token.line}, column {token.column}")
-        
+        # Hot path: one index (the IndexError doubles as the bounds
+        # check), one identity compare on the enum member, no string
+        # formatting; message construction lives in the cold helper
+        try:
+            token = self.tokens[self.current]
+        except IndexError:
+            raise ParseError("Expected %s, but reached end of input", expected_type)
+        if token.type is not expected_type:
+            self._raise_expect(expected_type, token)
         self.current += 1
-        return token 
\ No newline at end of file
+        return token
+    
+    def _raise_expect(self, expected_type: TokenType, token: Token) -> None:
+        """Cold path of expect(): build and raise the mismatch error"""
+        raise ParseError("Expected %s, but got %s at line %s, column %s", expected_type, token.type, token.line, token.column)
+
+    def release(self, node: ASTNode) -> None:
+        """Recycle a finished tree into the node free list.
+
+        Only call once nothing else references the tree; some
+        productions store nodes or node lists in .value, so both
+        channels are walked.
+        """
+        stack = [node]
+        pool = _NODE_POOL
+        while stack and len(pool) < _NODE_POOL_CAP:
+            n = stack.pop()
+            if type(n) is not ASTNode:
+                continue
+            stack.extend(n.children)
+            value = n.value
+            if type(value) is ASTNode:
+                stack.append(value)
+            elif type(value) is list:
+                stack.extend(value)
+            n.value = None
+            n.children = []
+            pool.append(n)
@@ -1,8 +1,10 @@
 from django.urls import path
+from django.views.generic import TemplateView
 from . import views
 
 urlpatterns = [
-    path('', views.code_editor, name='code_editor'),
+    path('', TemplateView.as_view(template_name='code_executor/index.html'),
+         name='code_editor'),
     path('execute_code/', views.execute_code, name='execute_code'),
     path('send_input/', views.send_input, name='send_input'),
 ]
\ No newline at end of file
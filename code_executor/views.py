@@ -1,102 +1,102 @@
 import json
-from django.shortcuts import render
+import logging
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from .c_compiler import CCompiler
 
-def code_editor(request):
-    """
-    Renders the front-end code editor.
-    """
-    return render(request, 'code_executor/index.html')
+logger = logging.getLogger(__name__)
 
-def code_editor(request):
-    """
-    Renders the front-end code editor.
-    """
-    return render(request, 'code_executor/index.html')
+# One compiler per worker process: construction probes the toolchain and
+# sets up the executable/analysis caches, and sharing the instance is
+# what lets those caches actually hit across requests. Per-run state in
+# compile_and_run lives in locals and cache access is lock-guarded, so
+# the shared instance is safe under Django's threaded deployment.
+_COMPILER = CCompiler()
+
+# Reject bodies larger than this before json.loads touches them;
+# pathological payloads should cost a header read, not a full parse
+_MAX_BODY_BYTES = 1_000_000
 
 @csrf_exempt
+@require_POST
 def execute_code(request):
     """
     Receives C code from the front-end, compiles it, and returns the output.
     """
-    if request.method == 'POST':
-        try:
-            # Parse JSON data from request body
-            data = json.loads(request.body)
-            c_code = data.get('c_code', '')
-            program_input = data.get('program_input', '')
-            
-            compiler = CCompiler()
-            result = compiler.compile_and_run(c_code, program_input)
-            
-            if result['success']:
-                # Compilation and execution successful
-                response_data = {
-                    'success': True,
-                    'output': result['output'],
-                    'error': '',
-                    'analysis': result['analysis']
-                }
-                # Include requires_input field if it exists
-                if 'requires_input' in result:
-                    response_data['requires_input'] = result['requires_input']
-                    print(f"Backend: requires_input = {result['requires_input']}")
-                else:
-                    print(f"Backend: requires_input not found in result")
-                print(f"Backend: sending response_data = {response_data}")
-                return JsonResponse(response_data)
+    try:
+        if int(request.META.get('CONTENT_LENGTH') or 0) > _MAX_BODY_BYTES:
+            return JsonResponse({'error': 'Request body too large.'}, status=413)
+        # Parse JSON data from request body
+        data = json.loads(request.body)
+        c_code = data.get('c_code', '')
+        program_input = data.get('program_input', '')
+        
+        result = _COMPILER.compile_and_run(c_code, program_input)
+        
+        if result['success']:
+            # Compilation and execution successful
+            response_data = {
+                'success': True,
+                'output': result['output'],
+                'error': '',
+                'analysis': result['analysis']
+            }
+            # Include requires_input field if it exists
+            if 'requires_input' in result:
+                response_data['requires_input'] = result['requires_input']
+                logger.debug("requires_input = %s", result['requires_input'])
             else:
-                # Compilation failed
-                return JsonResponse({
-                    'success': False,
-                    'output': '',
-                    'error': '\n'.join(result['errors']),
-                    'analysis': result['analysis']
-                })
-        except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON data.'}, status=400)
-        except Exception as e:
-            return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
-    
-    return JsonResponse({'error': 'Invalid request method.'}, status=400)
+                logger.debug("requires_input not found in result")
+            logger.debug("sending response_data = %s", response_data)
+            return JsonResponse(response_data)
+        else:
+            # Compilation failed
+            return JsonResponse({
+                'success': False,
+                'output': '',
+                'error': '\n'.join(result['errors']),
+                'analysis': result['analysis']
+            })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data.'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
 
 @csrf_exempt
+@require_POST
 def send_input(request):
     """
     Handle program input for interactive C programs.
     """
-    if request.method == 'POST':
-        try:
-            data = json.loads(request.body)
-            user_input = data.get('input', '')
-            c_code = data.get('c_code', '')  # We need the original code
-            
-            if not c_code:
-                return JsonResponse({'error': 'No C code provided.'}, status=400)
-            
-            if not user_input:
-                return JsonResponse({'error': 'No input provided.'}, status=400)
+    try:
+        if int(request.META.get('CONTENT_LENGTH') or 0) > _MAX_BODY_BYTES:
+            return JsonResponse({'error': 'Request body too large.'}, status=413)
+        data = json.loads(request.body)
+        user_input = data.get('input', '')
+        c_code = data.get('c_code', '')  # We need the original code
+        
+        if not c_code:
+            return JsonResponse({'error': 'No C code provided.'}, status=400)
+        
+        if not user_input:
+            return JsonResponse({'error': 'No input provided.'}, status=400)
+        
+        # Use the C compiler to run the program with input
+        result = _COMPILER.compile_and_run(c_code, user_input)
+        
+        if result['success']:
+            return JsonResponse({
+                'success': True,
+                'output': result['output']
+            })
+        else:
+            return JsonResponse({
+                'success': False,
+                'error': '\n'.join(result['errors'])
+            })
             
-            # Use the C compiler to run the program with input
-            compiler = CCompiler()
-            result = compiler.compile_and_run(c_code, user_input)
-            
-            if result['success']:
-                return JsonResponse({
-                    'success': True,
-                    'output': result['output']
-                })
-            else:
-                return JsonResponse({
-                    'success': False,
-                    'error': '\n'.join(result['errors'])
-                })
-                
-        except json.JSONDecodeError:
-            return JsonResponse({'error': 'Invalid JSON data.'}, status=400)
-        except Exception as e:
-            return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
-    
-    return JsonResponse({'error': 'Invalid request method.'}, status=400)
\ No newline at end of file
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data.'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
\ No newline at end of file
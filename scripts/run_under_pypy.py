@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Run a CA source file under PyPy when one is available.
+
+PyPy's tracing JIT compiles the interpreter's dispatch loops after a
+few thousand iterations, which is worth an order of magnitude on
+long-running programs. Two shapes matter for the JIT: the hot loops
+must live inside functions (CAInterpreter's statement/expression
+handlers do) and timed runs need warmup iterations so traces are
+compiled before measuring. This wrapper re-execs itself under pypy3 if
+one is on PATH and otherwise falls back to the current CPython.
+
+Usage:
+    python scripts/run_under_pypy.py program.ca
+    python scripts/run_under_pypy.py program.ca --time [--warmup N]
+"""
+import os
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv):
+    if not argv or argv[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        return 0
+
+    # Re-exec under PyPy unless we are already running on one
+    if '--no-reexec' not in argv and sys.implementation.name != 'pypy':
+        pypy = shutil.which('pypy3') or shutil.which('pypy')
+        if pypy:
+            os.execv(pypy, [pypy, os.path.abspath(__file__), '--no-reexec'] + argv)
+    argv = [a for a in argv if a != '--no-reexec']
+
+    source_path = argv[0]
+    timed = '--time' in argv
+    warmup = 3
+    if '--warmup' in argv:
+        warmup = int(argv[argv.index('--warmup') + 1])
+
+    with open(source_path) as f:
+        source = f.read()
+
+    from code_executor.ca_interpreter import CAInterpreter
+
+    if timed:
+        # Warmup lets a JIT compile its traces before the measured run
+        for _ in range(warmup):
+            CAInterpreter().execute(source)
+        start = time.perf_counter()
+        output = CAInterpreter().execute(source)
+        elapsed = time.perf_counter() - start
+        print(output)
+        print(f"[{sys.implementation.name}] {elapsed * 1000:.2f} ms "
+              f"(after {warmup} warmup runs)", file=sys.stderr)
+    else:
+        print(CAInterpreter().execute(source))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))